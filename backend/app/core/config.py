@@ -20,6 +20,16 @@ class Settings(BaseSettings):
     NEO4J_URI: str = os.getenv("NEO4J_URI", "bolt://localhost:7687")
     NEO4J_USER: str = os.getenv("NEO4J_USER", "neo4j")
     NEO4J_PASSWORD: str = os.getenv("NEO4J_PASSWORD", "password")
+    # Pinning the database avoids a home-database lookup on every session
+    NEO4J_DATABASE: str = os.getenv("NEO4J_DATABASE", "neo4j")
+    # Driver connection pool: concurrent sessions beyond the pool size wait
+    # up to the acquisition timeout (seconds) and then fail instead of
+    # queueing indefinitely; connections are recycled after their lifetime
+    NEO4J_POOL_SIZE: int = int(os.getenv("NEO4J_POOL_SIZE", "64"))
+    NEO4J_ACQUIRE_TIMEOUT: float = float(os.getenv("NEO4J_ACQUIRE_TIMEOUT", "15.0"))
+    NEO4J_MAX_CONNECTION_LIFETIME: int = int(
+        os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600")
+    )
 
     # JWT
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
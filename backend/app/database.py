@@ -1,7 +1,18 @@
-from neo4j import GraphDatabase
+from neo4j import GraphDatabase, READ_ACCESS, WRITE_ACCESS
 from app.core.config import settings
 from contextlib import contextmanager
-from typing import Generator
+from pathlib import Path
+from typing import Generator, List
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations" / "neo4j"
+SCHEMA_FILE = MIGRATIONS_DIR / "schema.cypher"
+
+# Data migrations run after the schema on every startup, in this order. Each
+# only touches nodes still in the old shape, so re-running them is a no-op.
+DATA_MIGRATION_FILES = (
+    MIGRATIONS_DIR / "word_pos_to_list.cypher",
+    MIGRATIONS_DIR / "text_counts.cypher",
+)
 
 # Neo4j driver instance
 driver = None
@@ -11,7 +22,11 @@ def init_neo4j():
     """Initialize Neo4j driver"""
     global driver
     driver = GraphDatabase.driver(
-        settings.NEO4J_URI, auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
+        settings.NEO4J_URI,
+        auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+        max_connection_pool_size=settings.NEO4J_POOL_SIZE,
+        connection_acquisition_timeout=settings.NEO4J_ACQUIRE_TIMEOUT,
+        max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME,
     )
 
 
@@ -22,14 +37,37 @@ def close_neo4j():
         driver.close()
 
 
+def load_schema_statements(path: Path = SCHEMA_FILE) -> List[str]:
+    """Split schema.cypher into individual statements, dropping // comments"""
+    lines = [
+        line
+        for line in path.read_text().splitlines()
+        if not line.lstrip().startswith("//")
+    ]
+    return [stmt.strip() for stmt in "\n".join(lines).split(";") if stmt.strip()]
+
+
+def apply_schema():
+    """Create the constraints and indexes from schema.cypher (all IF NOT EXISTS)
+    and bring existing data up to date with the idempotent data migrations"""
+    with get_db() as session:
+        for statement in load_schema_statements():
+            session.run(statement).consume()
+        for path in DATA_MIGRATION_FILES:
+            for statement in load_schema_statements(path):
+                session.run(statement).consume()
+
+
 @contextmanager
-def get_db() -> Generator:
-    """Get Neo4j database session"""
+def get_db(access_mode: str = WRITE_ACCESS) -> Generator:
+    """Get Neo4j database session bound to the configured database"""
     global driver
     if not driver:
         init_neo4j()
 
-    session = driver.session()
+    session = driver.session(
+        database=settings.NEO4J_DATABASE, default_access_mode=access_mode
+    )
     try:
         yield session
     finally:
@@ -40,3 +78,9 @@ def get_db_dependency():
     """FastAPI dependency for Neo4j session"""
     with get_db() as session:
         yield session
+
+
+def get_read_db_dependency():
+    """FastAPI dependency for a read-only Neo4j session (routable to replicas)"""
+    with get_db(access_mode=READ_ACCESS) as session:
+        yield session
@@ -1,7 +1,17 @@
 import uuid
-import xml.etree.ElementTree as ET
 from typing import Any, Dict, Iterable, Optional, Sequence
 
+try:
+    # lxml builds the same ElementTree API in C and pretty-prints while
+    # serializing, so the document is not walked again in Python to indent it
+    from lxml import etree as ET
+
+    HAS_LXML = True
+except ImportError:  # pragma: no cover - depends on installed packages
+    import xml.etree.ElementTree as ET
+
+    HAS_LXML = False
+
 
 _UUID_NS = uuid.UUID("11111111-1111-1111-1111-111111111111")
 
@@ -206,6 +216,11 @@ def build_interlinear_text_root(*, guid: Optional[str] = None) -> ET.Element:
 
 def serialize_xml(root: ET.Element) -> bytes:
     """Serialize XML root to UTF-8 bytes with declaration."""
+    if HAS_LXML:
+        return ET.tostring(
+            root, encoding="utf-8", xml_declaration=True, pretty_print=True
+        )
+
     _indent_xml(root)
     if not root.tail or not root.tail.strip():
         root.tail = "\n"
@@ -53,6 +53,47 @@ FOR (t:Text) ON (t.language_code);
 CREATE INDEX gloss_annotation IF NOT EXISTS
 FOR (g:Gloss) ON (g.annotation);
 
+// Uploads store the language on Text.language (text_language above covers the
+// legacy language_code property). These back the graph-data language filters
+// so `MATCH (n:Text) WHERE n.language = $language` plans as NodeIndexSeek
+// instead of NodeByLabelScan + Filter.
+CREATE INDEX text_language_value IF NOT EXISTS
+FOR (t:Text) ON (t.language);
+
+// Backs the /texts listing order and its keyset cursor
+// (created_at, ID) < ($after_created_at, $after_id). As a composite range
+// index it also serves predicates and ordering on created_at alone, so there
+// is no separate text created_at index.
+CREATE INDEX text_created_at_id IF NOT EXISTS
+FOR (t:Text) ON (t.created_at, t.ID);
+
+// Section ordering in exports and section listings (ORDER BY s.order)
+CREATE INDEX section_order IF NOT EXISTS
+FOR (s:Section) ON (s.order);
+
+CREATE INDEX morpheme_language IF NOT EXISTS
+FOR (m:Morpheme) ON (m.language);
+
+CREATE INDEX morpheme_type IF NOT EXISTS
+FOR (m:Morpheme) ON (m.type);
+
+// Text indexes for the CONTAINS filters in word/morpheme search (range
+// indexes cannot serve substring predicates)
+CREATE TEXT INDEX word_surface_form_text IF NOT EXISTS
+FOR (w:Word) ON (w.surface_form);
+
+CREATE TEXT INDEX word_gloss_text IF NOT EXISTS
+FOR (w:Word) ON (w.gloss);
+
+CREATE TEXT INDEX morpheme_surface_form_text IF NOT EXISTS
+FOR (m:Morpheme) ON (m.surface_form);
+
+CREATE TEXT INDEX morpheme_citation_form_text IF NOT EXISTS
+FOR (m:Morpheme) ON (m.citation_form);
+
+CREATE TEXT INDEX morpheme_gloss_text IF NOT EXISTS
+FOR (m:Morpheme) ON (m.gloss);
+
 
 // ---------------------
 // Relationship Pattern Documentation
@@ -0,0 +1,24 @@
+// ============================================================
+// Data migration: store section/word/morpheme counts on Text
+// ============================================================
+
+// Uploads now set Text.section_count, Text.word_count and
+// Text.morpheme_count, which the /texts listing reads directly. This
+// backfills texts stored before that change. Applied at API startup by
+// apply_schema(); only texts without counts match, so re-running it changes
+// nothing.
+
+MATCH (t:Text)
+WHERE t.section_count IS NULL
+CALL {
+    WITH t
+    OPTIONAL MATCH (t)-[:SECTION_PART_OF_TEXT]->(s:Section)
+    OPTIONAL MATCH (s)-[:SECTION_CONTAINS]->(w:Word)
+    OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m:Morpheme)
+    RETURN count(DISTINCT s) AS section_count,
+           count(DISTINCT w) AS word_count,
+           count(DISTINCT m) AS morpheme_count
+}
+SET t.section_count = section_count,
+    t.word_count = word_count,
+    t.morpheme_count = morpheme_count;
@@ -0,0 +1,12 @@
+// ============================================================
+// Data migration: Word.pos comma-joined string -> list of tags
+// ============================================================
+
+// Uploads now store Word.pos as a list (e.g. ["INTJ", "N"]) so search can
+// match a single tag with `$pos IN w.pos`. Words stored before that change
+// hold a comma-joined string. Applied at API startup by apply_schema(); only
+// string values match, so re-running it changes nothing.
+
+MATCH (w:Word)
+WHERE w.pos IS :: STRING
+SET w.pos = CASE w.pos WHEN '' THEN [] ELSE split(w.pos, ',') END;
@@ -2,7 +2,15 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Dict, Tuple, Union
 
-from pydantic import BaseModel, Field, ConfigDict, conint, confloat, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    ConfigDict,
+    conint,
+    confloat,
+    field_validator,
+    model_validator,
+)
 
 
 class BaseSchema(BaseModel):
@@ -64,9 +72,19 @@ class MorphemeCreate(IdSchema):
     surface_form: str = ""
     citation_form: str = ""
     gloss: str = ""
-    msa: Union[Dict[str, str], List[str], str] = ""
+    # Parsers may hand over msa as a dict or list; it is stored as a string
+    msa: str = ""
     language: str
 
+    @field_validator("msa", mode="before")
+    @classmethod
+    def msa_to_str(cls, value):
+        if isinstance(value, dict):
+            return ",".join(f"{k}:{v}" for k, v in value.items())
+        if isinstance(value, list):
+            return ",".join(map(str, value))
+        return value
+
 
 class WordCreate(IdSchema):
     surface_form: str
@@ -0,0 +1,24 @@
+"""XML backend shared by the upload parsers."""
+
+try:
+    # lxml parses large files several times faster than the stdlib parser and
+    # exposes the same ElementTree API; entity expansion and network access
+    # stay disabled for untrusted uploads
+    from lxml import etree as ET
+
+    HAS_LXML = True
+except ImportError:  # pragma: no cover - depends on installed packages
+    import xml.etree.ElementTree as ET
+
+    HAS_LXML = False
+
+
+def make_xml_parser():
+    """Return a fresh hardened parser for one parse (None means the default).
+
+    An lxml parser may only be used by one thread at a time and uploads are
+    parsed in worker threads, so a parser is never shared between parses.
+    """
+    if HAS_LXML:
+        return ET.XMLParser(resolve_entities=False, no_network=True)
+    return None
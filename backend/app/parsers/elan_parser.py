@@ -1,8 +1,7 @@
 
-from xml.etree import ElementTree as ET
 import uuid, json
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from app.models.linguistic import (
     InterlinearTextCreate,
     SectionCreate,
@@ -11,6 +10,7 @@ from app.models.linguistic import (
     MorphemeCreate,
     MorphemeType,
 )
+from app.parsers._xml import ET, make_xml_parser
 
 _UUID_NS = uuid.UUID("11111111-1111-1111-1111-111111111111")
 
@@ -45,7 +45,7 @@ class ElanDoc:
 
 class ElanParser:
     def parse_file(self, file_path: str) -> ElanDoc:
-        tree = ET.parse(file_path)
+        tree = ET.parse(file_path, make_xml_parser())
         root = tree.getroot()
         author = root.attrib.get("AUTHOR")
         date = root.attrib.get("DATE")
@@ -490,3 +490,12 @@ def get_elan_file_stats(file_path: str) -> Dict[str, Any]:
     parser = ElanParser()
     texts = parser.parse_to_interlinear_texts(file_path)
     return parser.get_language_stats(texts)
+
+
+def parse_elan_file_with_stats(
+    file_path: str,
+) -> Tuple[List[InterlinearTextCreate], Dict[str, Any]]:
+    """Parse an ELAN file once and return its texts together with their statistics"""
+    parser = ElanParser()
+    texts = parser.parse_to_interlinear_texts(file_path)
+    return texts, parser.get_language_stats(texts)
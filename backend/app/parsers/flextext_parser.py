@@ -1,7 +1,6 @@
-import xml.etree.ElementTree as ET
 import json
 import uuid
-from typing import List, Dict, Optional, Any
+from typing import IO, List, Dict, Optional, Any, Tuple, Union
 from app.models.linguistic import (
     InterlinearTextCreate,
     SectionCreate,
@@ -11,6 +10,7 @@ from app.models.linguistic import (
     MorphemeCreate,
     MorphemeType,
 )
+from app.parsers._xml import ET, make_xml_parser
 
 
 _UUID_NS = uuid.UUID("11111111-1111-1111-1111-111111111111")
@@ -27,9 +27,11 @@ class FlexTextParser:
     def __init__(self):
         self.namespace_map = {}
 
-    def parse_file(self, file_path: str) -> List[InterlinearTextCreate]:
-        """Parse a .flextext file and return list of InterlinearText objects"""
-        tree = ET.parse(file_path)
+    def parse_file(
+        self, file_path: Union[str, IO[bytes]]
+    ) -> List[InterlinearTextCreate]:
+        """Parse a .flextext file (path or binary file object) and return list of InterlinearText objects"""
+        tree = ET.parse(file_path, make_xml_parser())
         root = tree.getroot()
 
         # Handle namespace if present
@@ -391,19 +393,28 @@ class FlexTextParser:
         }
 
 
-def parse_flextext_file(file_path: str) -> List[InterlinearTextCreate]:
+def parse_flextext_file(file_path: Union[str, IO[bytes]]) -> List[InterlinearTextCreate]:
     """Convenience function to parse a FLEx file"""
     parser = FlexTextParser()
     return parser.parse_file(file_path)
 
 
-def get_file_stats(file_path: str) -> Dict[str, Any]:
+def get_file_stats(file_path: Union[str, IO[bytes]]) -> Dict[str, Any]:
     """Get statistics for a FLEx file"""
     parser = FlexTextParser()
     texts = parser.parse_file(file_path)
     return parser.get_language_stats(texts)
 
 
+def parse_flextext_file_with_stats(
+    file_path: Union[str, IO[bytes]]
+) -> Tuple[List[InterlinearTextCreate], Dict[str, Any]]:
+    """Parse a FLEx file once and return its texts together with their statistics"""
+    parser = FlexTextParser()
+    texts = parser.parse_file(file_path)
+    return texts, parser.get_language_stats(texts)
+
+
 # Methods for creating JSON objects from FLEx
 def _morpheme_to_dict(m) -> Dict[str, Any]:
     return {
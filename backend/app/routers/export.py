@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import Response
 from pydantic import BaseModel
 
-from app.database import get_db_dependency
+from app.core.cache import TTLCache
+from app.database import get_read_db_dependency
 from app.exporters import ExporterNotFoundError, get_exporter
-from app.services.neo4j_service import get_all_texts_graph_data
+from app.services.neo4j_service import get_all_texts_graph_data, get_export_fingerprint
 
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/export", tags=["export"])
 
+# Finished export bodies (immutable bytes), keyed on (file_type, data
+# fingerprint). On a miss, texts whose graph data is still in
+# neo4j_service.text_graph_cache are not re-fetched. Both caches are keyed on
+# the texts' current state and are cleared together by the upload/wipe
+# endpoints through linguistic._invalidate_read_caches().
+EXPORT_CACHE_TTL_SECONDS = 300
+export_cache = TTLCache(maxsize=64, ttl=EXPORT_CACHE_TTL_SECONDS)
+
 
 class ExportRequest(BaseModel):
     """Request body for triggering a FLEXText export."""
@@ -28,7 +38,7 @@ class ExportRequest(BaseModel):
 async def export_dataset(
     payload: ExportRequest,
     file_type: str = Query("flextext", alias="file_type"),
-    db=Depends(get_db_dependency),
+    db=Depends(get_read_db_dependency),
 ) -> Response:
     """Return a FLEXText export for the requested dataset."""
 
@@ -52,33 +62,29 @@ async def export_dataset(
     logger.info("Starting export", extra=context)
 
     try:
-        graph_payloads = get_all_texts_graph_data(db)
+        fingerprint = await asyncio.to_thread(get_export_fingerprint, db)
     except Exception as exc:  # pragma: no cover - defensive logging path
-        logger.exception("Failed to retrieve graph data for export", extra=context)
+        logger.exception("Failed to fingerprint export data", extra=context)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Unable to retrieve export data",
         ) from exc
 
-    if not graph_payloads:
-        message = "No texts available for export"
-        logger.warning("Export failed: no texts found", extra={**context, "error": message})
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
-
-    try:
-        export_payload = exporter.export({"texts": graph_payloads})
-    except Exception as exc:  # pragma: no cover - unexpected generation issue
-        logger.exception("Failed to serialize export payload", extra=context)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Unable to generate export output",
-        ) from exc
+    # The output depends only on the exporter and the stored texts, not on
+    # file_id (which just names the download)
+    etag = f'"{exporter.file_type}-{fingerprint}"'
+    cache_key = (exporter.file_type, fingerprint)
+    export_payload = export_cache.get(cache_key)
+    if export_payload is None:
+        export_payload = await _generate_export(exporter, db, context)
+        export_cache.set(cache_key, export_payload)
 
     filename_base = file_id or "export"
     filename = f"{filename_base}.{exporter.file_extension}"
     headers = {
         "Content-Disposition": f"attachment; filename=\"{filename}\"",
         "X-Lexiconnect-Export": exporter.file_type,
+        "ETag": etag,
     }
 
     logger.info(
@@ -88,3 +94,35 @@ async def export_dataset(
 
     return Response(content=export_payload, media_type=exporter.media_type, headers=headers)
 
+
+async def _generate_export(exporter, db, context: dict) -> bytes:
+    """Fetch every text's graph data and run it through ``exporter``."""
+
+    try:
+        # The driver call and XML generation are blocking; keep them off the
+        # event loop so concurrent exports don't stall other requests
+        graph_payloads = await asyncio.to_thread(get_all_texts_graph_data, db)
+    except Exception as exc:  # pragma: no cover - defensive logging path
+        logger.exception("Failed to retrieve graph data for export", extra=context)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Unable to retrieve export data",
+        ) from exc
+
+    if not graph_payloads:
+        message = "No texts available for export"
+        logger.warning("Export failed: no texts found", extra={**context, "error": message})
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
+
+    try:
+        export_payload = await asyncio.to_thread(
+            exporter.export, {"texts": graph_payloads}
+        )
+    except Exception as exc:  # pragma: no cover - unexpected generation issue
+        logger.exception("Failed to serialize export payload", extra=context)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Unable to generate export output",
+        ) from exc
+
+    return export_payload.encode("utf-8")
@@ -1,32 +1,38 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Response, Query
-from typing import List, Optional, Any, Tuple
-from pydantic import ValidationError
-from app.database import get_db_dependency
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional, Any, Dict, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from pydantic import TypeAdapter, ValidationError
+from neo4j.exceptions import ClientError
+from app.core.cache import TTLCache
+from app.database import get_db_dependency, get_read_db_dependency
+from app.routers.export import export_cache
+from app.services.neo4j_service import text_graph_cache
 from app.models.linguistic import (
     InterlinearTextCreate,
     InterlinearTextResponse,
     WordCreate,
     WordSearchQuery,
     WordResponse,
-    MorphemeCreate,
     MorphemeSearchQuery,
     MorphemeResponse,
-    SectionCreate,
-    PhraseCreate,
     ConcordanceQuery,
     ConcordanceResult,
     GlossTarget,
 )
-from app.parsers.flextext_parser import parse_flextext_file, get_file_stats
+from app.parsers.flextext_parser import parse_flextext_file_with_stats
 from app.parsers.elan_parser import (
     parse_eaf_file as parse_elan_eaf_file,
     parse_eaf_to_json_string as parse_elan_eaf_to_json_string,
-    parse_elan_file,
-    get_elan_file_stats,
+    parse_elan_file_with_stats,
 )
-import tempfile
+import aiofiles
+import asyncio
 import os
-import traceback
+import shutil
+from urllib.parse import urlencode
 import logging
 
 logger = logging.getLogger(__name__)
@@ -37,6 +43,322 @@ GRAPH_DATA_MIN_LIMIT = 10
 GRAPH_DATA_MAX_LIMIT = 1000
 GRAPH_DATA_DEFAULT_LIMIT = 200
 
+# Recent graph-data responses (serialized JSON), keyed on the query parameters
+GRAPH_DATA_CACHE_TTL_SECONDS = 30
+graph_data_cache = TTLCache(maxsize=32, ttl=GRAPH_DATA_CACHE_TTL_SECONDS)
+
+# Other slow-changing reads (/stats, /graph-filters, /texts), keyed on the
+# endpoint name plus its parameters
+READ_CACHE_TTL_SECONDS = 30
+read_cache = TTLCache(maxsize=1024, ttl=READ_CACHE_TTL_SECONDS)
+
+# Colors for each node type in the graph visualization
+NODE_COLORS = MappingProxyType(
+    {
+        "Text": "#f59e0b",  # amber
+        "Section": "#8b5cf6",  # purple
+        "Phrase": "#06b6d4",  # cyan
+        "Word": "#0ea5e9",  # blue
+        "Morpheme": "#10b981",  # green
+        "Gloss": "#ec4899",  # pink
+    }
+)
+DEFAULT_NODE_COLOR = "#64748b"
+
+# Sizes for each node type (larger = more important in hierarchy)
+NODE_SIZES = MappingProxyType(
+    {
+        "Text": 30,
+        "Section": 22,
+        "Phrase": 16,
+        "Word": 8,
+        "Morpheme": 6,
+        "Gloss": 7,
+    }
+)
+DEFAULT_NODE_SIZE = 10
+
+
+# Cypher map projection for graph-data sample queries (node bound to `n`).
+# Only the properties the UI reads are sent, so large property bags and
+# temporal values never cross the wire. The display label is picked per node
+# type here too, with long glosses/phrase texts truncated server-side.
+GRAPH_NODE_MAP = (
+    "{id: toString(id(n)), type: labels(n)[0], "
+    "label: CASE labels(n)[0] "
+    "WHEN 'Text' THEN coalesce(n.title, n.ID, '') "
+    "WHEN 'Word' THEN coalesce(n.surface_form, n.ID, '') "
+    "WHEN 'Morpheme' THEN coalesce(n.surface_form, n.citation_form, n.ID, '') "
+    "WHEN 'Gloss' THEN substring(coalesce(n.annotation, n.ID, ''), 0, 20) "
+    "WHEN 'Phrase' THEN substring(coalesce(n.surface_text, n.ID, ''), 0, 30) "
+    "ELSE coalesce(n.ID, '') END, "
+    "props: {ID: n.ID, "
+    "title: n.title, "
+    "surface_form: n.surface_form, "
+    "citation_form: n.citation_form, "
+    "annotation: substring(n.annotation, 0, 20), "
+    "surface_text: substring(n.surface_text, 0, 30)}}"
+)
+
+
+# graph-data queries are built once at import time (or memoized per label set)
+# and only ever take bolt parameters ($text_id, $language, $limit), so each
+# request reuses the same query strings and Neo4j's cached plans.
+#
+# Both node selections end in GRAPH_NODES_AND_EDGES, which collects the
+# selected nodes and matches the relationships between them in the same
+# statement. End nodes are checked against a primitive id list rather than
+# the node list, and ids travel as the strings the API returns.
+GRAPH_NODES_AND_EDGES = f"""
+    WITH collect(DISTINCT n) AS ns
+    WITH ns, [x IN ns | id(x)] AS ids
+    CALL {{
+        WITH ns, ids
+        UNWIND ns AS a
+        MATCH (a)-[r]->(b)
+        WHERE id(b) IN ids
+        RETURN collect({{
+            source: toString(id(a)),
+            target: toString(id(b)),
+            type: type(r)
+        }}) AS allEdges
+    }}
+    RETURN [n IN ns | {GRAPH_NODE_MAP}] AS allNodes, allEdges
+"""
+
+GRAPH_TEXT_QUERY = f"""
+    MATCH (t:Text {{ID: $text_id}})-[*0..3]->(n)
+    WITH DISTINCT n
+    LIMIT $limit
+    {GRAPH_NODES_AND_EDGES}
+"""
+
+GRAPH_SAMPLE_LABELS = ("Text", "Section", "Phrase", "Word", "Morpheme", "Gloss")
+
+GRAPH_SAMPLE_QUERIES = {
+    label: f"MATCH (n:{label}) RETURN n LIMIT $limit" for label in GRAPH_SAMPLE_LABELS
+}
+
+# Labels with a language property; backed by the language indexes in
+# schema.cypher (expected plan: NodeIndexSeek -> Limit)
+GRAPH_SAMPLE_LANGUAGE_QUERIES = {
+    label: f"MATCH (n:{label}) WHERE n.language = $language RETURN n LIMIT $limit"
+    for label in ("Text", "Word", "Morpheme")
+}
+
+
+@lru_cache(maxsize=None)
+def _graph_sample_query(labels: Tuple[str, ...], by_language: bool) -> str:
+    """Sample every requested label, and the edges between them, in one query
+
+    Only the label set and whether a language is given shape the query, so
+    there are few distinct strings and each keeps its cached plan.
+    """
+    branches = [
+        GRAPH_SAMPLE_LANGUAGE_QUERIES[label]
+        if by_language and label in GRAPH_SAMPLE_LANGUAGE_QUERIES
+        else GRAPH_SAMPLE_QUERIES[label]
+        for label in labels
+    ]
+    return (
+        "CALL {\n"
+        + "\nUNION ALL\n".join(branches)
+        + "\n}\n"
+        + GRAPH_NODES_AND_EDGES
+    )
+
+
+# Word/morpheme search queries. Every filter is always present and switched
+# off by passing null, so each endpoint sends one fixed query string and
+# Neo4j can reuse its cached plan whichever filters a request uses.
+WORD_SEARCH_MATCH = """
+    MATCH (w:Word)
+    WHERE ($surface_form IS NULL OR w.surface_form CONTAINS $surface_form)
+      AND ($gloss IS NULL OR w.gloss CONTAINS $gloss)
+      AND ($pos IS NULL OR $pos IN w.pos)
+      AND ($language IS NULL OR w.language = $language)
+      AND ($contains_morpheme IS NULL OR EXISTS {
+            MATCH (w)-[:WORD_MADE_OF]->(m:Morpheme)
+            WHERE m.surface_form CONTAINS $contains_morpheme
+               OR m.citation_form CONTAINS $contains_morpheme
+          })
+"""
+
+# Total and page come back in one record (uncorrelated CALL subqueries), so
+# the total is still reported when the page is empty
+WORD_SEARCH_CYPHER = f"""
+    CALL {{
+        {WORD_SEARCH_MATCH}
+        RETURN count(w) AS total
+    }}
+    CALL {{
+        {WORD_SEARCH_MATCH}
+        WITH w
+        ORDER BY w.surface_form
+        SKIP $offset
+        LIMIT $limit
+        RETURN collect({{
+            ID: w.ID, surface_form: w.surface_form,
+            gloss: w.gloss, pos: w.pos, language: w.language,
+            morpheme_count: COUNT {{ (w)-[:WORD_MADE_OF]->(:Morpheme) }},
+            created_at: toString(w.created_at)
+        }}) AS rows
+    }}
+    RETURN total, rows
+"""
+
+MORPHEME_SEARCH_MATCH = """
+    MATCH (m:Morpheme)
+    WHERE ($surface_form IS NULL OR m.surface_form CONTAINS $surface_form)
+      AND ($citation_form IS NULL OR m.citation_form CONTAINS $citation_form)
+      AND ($gloss IS NULL OR m.gloss CONTAINS $gloss)
+      AND ($type IS NULL OR m.type = $type)
+      AND ($language IS NULL OR m.language = $language)
+"""
+
+MORPHEME_SEARCH_CYPHER = f"""
+    CALL {{
+        {MORPHEME_SEARCH_MATCH}
+        RETURN count(m) AS total
+    }}
+    CALL {{
+        {MORPHEME_SEARCH_MATCH}
+        WITH m
+        ORDER BY m.citation_form
+        SKIP $offset
+        LIMIT $limit
+        RETURN collect({{
+            ID: m.ID, type: m.type,
+            surface_form: m.surface_form, citation_form: m.citation_form,
+            gloss: m.gloss, msa: m.msa, language: m.language,
+            created_at: toString(m.created_at)
+        }}) AS rows
+    }}
+    RETURN total, rows
+"""
+
+
+# Search rows are validated against the response models in one pass; the
+# Cypher projections above already have the models' shape
+WORD_SEARCH_ROWS = TypeAdapter(List[WordResponse])
+MORPHEME_SEARCH_ROWS = TypeAdapter(List[MorphemeResponse])
+
+# Section/word/morpheme counts are stored on the Text when it is uploaded so
+# the /texts listing reads them instead of expanding every text's subgraph
+TEXT_COUNTS_QUERY = """
+    MATCH (t:Text {ID: $ID})
+    CALL {
+        WITH t
+        OPTIONAL MATCH (t)-[:SECTION_PART_OF_TEXT]->(s:Section)
+        OPTIONAL MATCH (s)-[:SECTION_CONTAINS]->(w:Word)
+        OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m:Morpheme)
+        RETURN count(DISTINCT s) AS section_count,
+               count(DISTINCT w) AS word_count,
+               count(DISTINCT m) AS morpheme_count
+    }
+    SET t.section_count = section_count,
+        t.word_count = word_count,
+        t.morpheme_count = morpheme_count
+"""
+
+TEXT_LIST_MATCH = """
+    MATCH (t:Text)
+    WHERE ($language IS NULL OR t.language = $language)
+"""
+
+# Listing pages are ordered by (created_at, ID), newest first. A page can
+# start after the last row of the previous one (keyset pagination) instead of
+# skipping over every earlier row; SKIP is still accepted for offset-based
+# clients. Texts stored without created_at or ID sort as the epoch and by
+# their internal id, and the cursor carries those same sort values so paging
+# reaches them too.
+TEXT_LIST_CYPHER = f"""
+    CALL {{
+        {TEXT_LIST_MATCH}
+        RETURN count(t) AS total
+    }}
+    CALL {{
+        {TEXT_LIST_MATCH}
+        WITH t,
+             COALESCE(t.created_at, datetime({{epochMillis: 0}})) AS sort_created_at,
+             COALESCE(t.ID, toString(id(t))) AS sort_id
+        WHERE $after_created_at IS NULL
+           OR sort_created_at < datetime($after_created_at)
+           OR (sort_created_at = datetime($after_created_at)
+               AND sort_id < $after_id)
+        ORDER BY sort_created_at DESC, sort_id DESC
+        SKIP $skip
+        LIMIT $limit
+        RETURN collect({{
+            ID: sort_id,
+            title: COALESCE(t.title, ''),
+            source: COALESCE(t.source, ''),
+            comment: COALESCE(t.comment, ''),
+            language: COALESCE(t.language, ''),
+            section_count: COALESCE(t.section_count, 0),
+            word_count: COALESCE(t.word_count, 0),
+            morpheme_count: COALESCE(t.morpheme_count, 0),
+            created_at: toString(COALESCE(t.created_at, datetime()))
+        }}) AS rows,
+        collect([toString(sort_created_at), sort_id]) AS cursors
+    }}
+    RETURN total, rows, cursors[-1] AS last_cursor
+"""
+
+
+STATS_NODE_LABELS = ("Text", "Section", "Phrase", "Word", "Morpheme", "Gloss")
+
+# /stats reads node and relationship counts from APOC's store statistics
+# when the plugin is installed (it is in docker-compose)
+STATS_APOC_QUERY = """
+    CALL apoc.meta.stats() YIELD labels, relCount
+    RETURN labels, relCount
+"""
+
+# Without APOC: node counts in one round trip; each subquery is a
+# single-label count, which Neo4j answers from its count store without
+# scanning, as is the unlabelled relationship count
+STATS_NODE_COUNTS_QUERY = """
+    CALL { MATCH (n:Text) RETURN count(n) AS text_count }
+    CALL { MATCH (n:Section) RETURN count(n) AS section_count }
+    CALL { MATCH (n:Phrase) RETURN count(n) AS phrase_count }
+    CALL { MATCH (n:Word) RETURN count(n) AS word_count }
+    CALL { MATCH (n:Morpheme) RETURN count(n) AS morpheme_count }
+    CALL { MATCH (n:Gloss) RETURN count(n) AS gloss_count }
+    RETURN text_count, section_count, phrase_count,
+           word_count, morpheme_count, gloss_count
+"""
+
+STATS_RELATIONSHIP_COUNT_QUERY = "MATCH ()-[r]->() RETURN count(r) AS count"
+
+# Whether apoc.meta.stats() exists; found out on the first /stats request
+_apoc_meta_stats_available: Optional[bool] = None
+
+
+# Rows sent per UNWIND statement when storing uploaded texts
+UPLOAD_BATCH_SIZE = 5000
+
+# Nodes deleted per transaction when wiping the database
+WIPE_BATCH_SIZE = 10000
+
+# Uploads are copied in chunks of this size rather than read whole into memory
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _invalidate_read_caches() -> None:
+    """Drop cached read responses after the graph has been modified"""
+    graph_data_cache.clear()
+    read_cache.clear()
+    export_cache.clear()
+    text_graph_cache.clear()
+
+
+def _copy_upload(source, path: str) -> None:
+    """Copy an upload's spooled body to ``path`` in UPLOAD_CHUNK_SIZE chunks"""
+    source.seek(0)
+    with open(path, "wb") as target:
+        shutil.copyfileobj(source, target, UPLOAD_CHUNK_SIZE)
+
 
 @router.post("/upload-flextext")
 async def upload_flextext_file(
@@ -44,54 +366,50 @@ async def upload_flextext_file(
 ):
     """Upload and parse a FLEx .flextext file and store in Neo4j using DATABASE.md schema"""
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".flextext") as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-
-        try:
-            # Parse the file
-            texts = parse_flextext_file(temp_file_path)
-            stats = get_file_stats(temp_file_path)
+        # UploadFile already spools the request body (in memory, or on disk
+        # when large), so parse it in place instead of copying it first.
+        # Parse once (stats come from the parsed texts) on a worker thread so
+        # the event loop keeps serving other requests
+        file.file.seek(0)
+        texts, stats = await asyncio.to_thread(
+            parse_flextext_file_with_stats, file.file
+        )
 
-            # Store in graph database using correct schema
-            processed_texts = []
-            skipped_texts = []
+        # Store in graph database using correct schema, in one write
+        # transaction for the whole file (committed when the block exits
+        # cleanly, rolled back on error)
+        processed_texts = []
+        skipped_texts = []
+        with db.begin_transaction() as tx:
             for text in texts:
-                text_id, was_created = await _store_interlinear_text(text, db)
+                text_id, was_created = await _store_interlinear_text(text, tx)
                 processed_texts.append(text_id)
                 if not was_created:
                     skipped_texts.append(
                         {"id": text_id, "title": text.title or text_id}
                     )
+        _invalidate_read_caches()
 
-            message = f"Successfully uploaded and processed {file.filename}"
-            if skipped_texts:
-                skipped_count = len(skipped_texts)
-                message += f". {skipped_count} text(s) were skipped because they already exist in the database."
-
-            return {
-                "message": message,
-                "file_stats": stats,
-                "processed_texts": processed_texts,
-                "skipped_texts": skipped_texts,
-                "skipped_count": len(skipped_texts),
-            }
+        message = f"Successfully uploaded and processed {file.filename}"
+        if skipped_texts:
+            skipped_count = len(skipped_texts)
+            message += f". {skipped_count} text(s) were skipped because they already exist in the database."
 
-        finally:
-            # Clean up temp file
-            os.unlink(temp_file_path)
+        return {
+            "message": message,
+            "file_stats": stats,
+            "processed_texts": processed_texts,
+            "skipped_texts": skipped_texts,
+            "skipped_count": len(skipped_texts),
+        }
 
     except ValidationError as e:
         error_msg = f"Validation error: {e.errors()}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
+        logger.exception("Validation error in upload: %s", e)
         raise HTTPException(status_code=400, detail=error_msg)
     except Exception as e:
         error_msg = f"Error processing file: {str(e)}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
+        logger.exception("Error processing file: %s", e)
         raise HTTPException(status_code=400, detail=error_msg)
 
 
@@ -99,27 +417,33 @@ async def upload_flextext_file(
 async def upload_elan_file(file: UploadFile = File(...), db=Depends(get_db_dependency)):
     """Upload and parse an ELAN .eaf file and store in Neo4j using DATABASE.md schema (matching Flex model)"""
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".eaf") as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # The ELAN parser derives IDs from a file path, so write the upload into
+        # a throwaway directory that is removed (off the event loop) together
+        # with the file
+        async with aiofiles.tempfile.TemporaryDirectory() as temp_dir:
+            file_name = os.path.basename(file.filename or "") or "upload.eaf"
+            temp_file_path = os.path.join(temp_dir, file_name)
+            await asyncio.to_thread(_copy_upload, file.file, temp_file_path)
 
-        try:
             # Parse the file using the new ELAN parser (returns InterlinearTextCreate objects)
-            texts = parse_elan_file(temp_file_path)
-            stats = get_elan_file_stats(temp_file_path)
+            # once, on a worker thread off the event loop
+            texts, stats = await asyncio.to_thread(
+                parse_elan_file_with_stats, temp_file_path
+            )
 
-            # Store in graph database using correct schema (same as Flex)
+            # Store in graph database using correct schema (same as Flex), in
+            # one write transaction for the whole file
             processed_texts = []
             skipped_texts = []
-            for text in texts:
-                text_id, was_created = await _store_interlinear_text(text, db)
-                processed_texts.append(text_id)
-                if not was_created:
-                    skipped_texts.append(
-                        {"id": text_id, "title": text.title or text_id}
-                    )
+            with db.begin_transaction() as tx:
+                for text in texts:
+                    text_id, was_created = await _store_interlinear_text(text, tx)
+                    processed_texts.append(text_id)
+                    if not was_created:
+                        skipped_texts.append(
+                            {"id": text_id, "title": text.title or text_id}
+                        )
+            _invalidate_read_caches()
 
             message = f"Successfully uploaded and processed {file.filename}"
             if skipped_texts:
@@ -134,23 +458,17 @@ async def upload_elan_file(file: UploadFile = File(...), db=Depends(get_db_depen
                 "skipped_count": len(skipped_texts),
             }
 
-        finally:
-            # Clean up temp file
-            os.unlink(temp_file_path)
-
     except ValidationError as e:
         error_msg = f"Validation error: {e.errors()}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
+        logger.exception("Validation error in upload: %s", e)
         raise HTTPException(status_code=400, detail=error_msg)
     except Exception as e:
         error_msg = f"Error processing ELAN file: {str(e)}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
+        logger.exception("Error processing ELAN file: %s", e)
         raise HTTPException(status_code=400, detail=error_msg)
 
 
-def _store_elan_graph(parsed_doc: Any, db) -> dict:
+def _store_elan_graph(parsed_doc: Any, tx) -> dict:
     """Persist ELAN JSON into Neo4j as ElanDoc/ElanTier/ElanAnnotation nodes.
 
     Returns counts of created/merged nodes and relationships.
@@ -163,7 +481,7 @@ def _store_elan_graph(parsed_doc: Any, db) -> dict:
     doc_id = f"elan:{file_name}"
 
     # Create/merge ElanDoc
-    db.run(
+    tx.run(
         """
         MERGE (d:ElanDoc {ID: $ID})
           ON CREATE SET d.created_at = datetime()
@@ -178,83 +496,84 @@ def _store_elan_graph(parsed_doc: Any, db) -> dict:
         date=date,
     )
 
-    tier_count = 0
-    ann_count = 0
-
+    tier_rows = []
+    ann_rows = []
     for tier in parsed_doc.get("tiers", []):
         tier_id = tier.get("tier_id") or ""
         node_id = f"{doc_id}#tier:{tier_id}"
-
-        db.run(
-            """
-            MATCH (d:ElanDoc {ID: $doc_id})
-            MERGE (t:ElanTier {ID: $ID})
-              ON CREATE SET t.created_at = datetime()
-            SET t.tier_id = $tier_id,
-                t.participant = $participant,
-                t.linguistic_type_ref = $linguistic_type_ref,
-                t.parent_ref = $parent_ref,
-                t.updated_at = datetime()
-            MERGE (d)-[:HAS_TIER]->(t)
-            """,
-            doc_id=doc_id,
-            ID=node_id,
-            tier_id=tier_id,
-            participant=tier.get("participant"),
-            linguistic_type_ref=tier.get("linguistic_type_ref"),
-            parent_ref=tier.get("parent_ref"),
+        tier_rows.append(
+            {
+                "doc_id": doc_id,
+                "ID": node_id,
+                "tier_id": tier_id,
+                "participant": tier.get("participant"),
+                "linguistic_type_ref": tier.get("linguistic_type_ref"),
+                "parent_ref": tier.get("parent_ref"),
+            }
         )
-        tier_count += 1
 
         for ann in tier.get("annotations", []):
             ann_id = ann.get("id") or ""
-            ann_node_id = f"{node_id}#ann:{ann_id}"
-
-            db.run(
-                """
-                MATCH (t:ElanTier {ID: $tier_node_id})
-                MERGE (a:ElanAnnotation {ID: $ID})
-                  ON CREATE SET a.created_at = datetime()
-                SET a.value = $value,
-                    a.start_ms = $start_ms,
-                    a.end_ms = $end_ms,
-                    a.ref_id = $ref_id,
-                    a.updated_at = datetime()
-                MERGE (t)-[:HAS_ANNOTATION]->(a)
-                """,
-                tier_node_id=node_id,
-                ID=ann_node_id,
-                value=ann.get("value"),
-                start_ms=ann.get("start_ms"),
-                end_ms=ann.get("end_ms"),
-                ref_id=ann.get("ref_id"),
+            ann_rows.append(
+                {
+                    "tier_node_id": node_id,
+                    "ID": f"{node_id}#ann:{ann_id}",
+                    "value": ann.get("value"),
+                    "start_ms": ann.get("start_ms"),
+                    "end_ms": ann.get("end_ms"),
+                    "ref_id": ann.get("ref_id"),
+                }
             )
-            ann_count += 1
 
-    return {"tiers": tier_count, "annotations": ann_count}
+    # One UNWIND per node kind instead of a round trip per tier/annotation
+    _run_unwind(
+        tx,
+        """
+        UNWIND $rows AS row
+        MATCH (d:ElanDoc {ID: row.doc_id})
+        MERGE (t:ElanTier {ID: row.ID})
+          ON CREATE SET t.created_at = datetime()
+        SET t.tier_id = row.tier_id,
+            t.participant = row.participant,
+            t.linguistic_type_ref = row.linguistic_type_ref,
+            t.parent_ref = row.parent_ref,
+            t.updated_at = datetime()
+        MERGE (d)-[:HAS_TIER]->(t)
+        """,
+        tier_rows,
+    )
+
+    _run_unwind(
+        tx,
+        """
+        UNWIND $rows AS row
+        MATCH (t:ElanTier {ID: row.tier_node_id})
+        MERGE (a:ElanAnnotation {ID: row.ID})
+          ON CREATE SET a.created_at = datetime()
+        SET a.value = row.value,
+            a.start_ms = row.start_ms,
+            a.end_ms = row.end_ms,
+            a.ref_id = row.ref_id,
+            a.updated_at = datetime()
+        MERGE (t)-[:HAS_ANNOTATION]->(a)
+        """,
+        ann_rows,
+    )
 
+    return {"tiers": len(tier_rows), "annotations": len(ann_rows)}
 
-async def _store_interlinear_text(text: InterlinearTextCreate, db) -> Tuple[str, bool]:
+
+async def _store_interlinear_text(text: InterlinearTextCreate, tx) -> Tuple[str, bool]:
     """Store an interlinear text using DATABASE.md schema relationships
 
     Returns:
         tuple: (text_id, was_created) where was_created is True if the text was newly created,
                False if it already existed in the database
     """
-    # Check if text already exists
-    existing_text = db.run(
-        """
-        MATCH (t:Text {ID: $ID})
-        RETURN t.ID as ID, t.title as title
-        """,
-        ID=text.id,
-    ).single()
-
-    was_created = existing_text is None
-
-    # Create the Text node with ID property (matching schema)
-    # Use MERGE directly without MATCH to avoid Cartesian products
-    db.run(
+    # Create the Text node with ID property (matching schema) and learn whether
+    # it already existed in the same statement. datetime() is fixed for the
+    # whole statement, so created_at only equals it if ON CREATE just ran.
+    record = tx.run(
         """
         MERGE (t:Text {ID: $ID})
           ON CREATE SET t.created_at = datetime()
@@ -263,377 +582,367 @@ async def _store_interlinear_text(text: InterlinearTextCreate, db) -> Tuple[str,
             t.comment = $comment,
             t.language = $language,
             t.updated_at = datetime()
+        RETURN coalesce(t.created_at = datetime(), false) AS was_created
         """,
         ID=text.id,
         title=text.title,
         source=text.source,
         comment=text.comment,
         language=text.language,
-    )
+    ).single()
+    was_created = record["was_created"]
 
-    # Only store sections if this is a new text (to avoid duplicating sections)
+    # Only store sections if this is a new text (to avoid duplicating sections).
+    # The child writes depend on each other (sections before phrases, words
+    # before their edges) and share one non-thread-safe transaction, so rather
+    # than fanning them out they run in order on a worker thread, keeping the
+    # event loop free for other requests while the batches are written.
     if was_created:
-        # Store sections and their components using correct relationships
-        for section in text.sections:
-            await _store_section(section, text.id, db)
+        await asyncio.to_thread(_write_flattened_text, _flatten_text(text), tx)
+        await asyncio.to_thread(tx.run, TEXT_COUNTS_QUERY, ID=text.id)
 
     return (text.id, was_created)
 
 
-async def _store_section(section: SectionCreate, text_id: str, db):
-    """Store a Section node with SECTION_PART_OF_TEXT relationship"""
+@dataclass
+class _FlattenedText:
+    """Row lists for one text, consumed by :func:`_write_flattened_text`.
+
+    Word, Morpheme and Gloss rows are keyed by ID so a node reused across
+    sections/phrases is written once; only the edge lists grow per occurrence.
+    """
+
+    sections: List[Dict[str, Any]] = field(default_factory=list)
+    phrases: List[Dict[str, Any]] = field(default_factory=list)
+    words: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    morphemes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    word_glosses: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    morph_glosses: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    word_in_section_edges: List[Dict[str, Any]] = field(default_factory=list)
+    word_in_phrase_edges: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _flatten_text(text: InterlinearTextCreate) -> _FlattenedText:
+    """Walk the text tree once and emit one row per node and relationship"""
+    acc = _FlattenedText()
+
+    for section in text.sections:
+        acc.sections.append(
+            {"text_id": text.id, "ID": section.id, "order": section.order}
+        )
+
+        for phrase in section.phrases:
+            acc.phrases.append(
+                {
+                    "section_id": section.id,
+                    "ID": phrase.id,
+                    "segnum": phrase.segnum,
+                    "surface_text": phrase.surface_text,
+                    "language": phrase.language,
+                }
+            )
+            # PHRASE_COMPOSED_OF carries the word's position as its Order property
+            for idx, word in enumerate(phrase.words):
+                _flatten_word(word, "phrase", phrase.id, idx, acc)
+
+        for idx, word in enumerate(section.words):
+            _flatten_word(word, "section", section.id, idx, acc)
+
+    return acc
+
 
-    # Create Section node and link to Text in one query to avoid Cartesian products
-    db.run(
+def _flatten_word(
+    w: WordCreate, parent_kind: str, parent_id: str, order: int, acc: _FlattenedText
+) -> None:
+    """Append the Word, its Morphemes and their Gloss rows to ``acc``"""
+    if parent_kind == "section":
+        acc.word_in_section_edges.append({"section_id": parent_id, "word_id": w.id})
+    else:
+        acc.word_in_phrase_edges.append(
+            {"phrase_id": parent_id, "word_id": w.id, "order": order}
+        )
+
+    # Node rows are only built for the first occurrence of a Word ID
+    if w.id in acc.words:
+        return
+
+    acc.words[w.id] = {
+        "ID": w.id,
+        "surface_form": w.surface_form,
+        "gloss": w.gloss,
+        # Stored as a native list so search can match single tags
+        "pos": w.pos,
+        "language": w.language,
+    }
+
+    if w.gloss:
+        gloss_id = f"gloss-word-{w.id}"
+        acc.word_glosses[gloss_id] = {
+            "ID": gloss_id,
+            "target_id": w.id,
+            "annotation": w.gloss,
+        }
+
+    for morpheme in w.morphemes:
+        if morpheme.id in acc.morphemes:
+            continue
+
+        acc.morphemes[morpheme.id] = {
+            "word_id": w.id,
+            "ID": morpheme.id,
+            "type": morpheme.type.value,
+            "surface_form": morpheme.surface_form,
+            "citation_form": morpheme.citation_form,
+            "gloss": morpheme.gloss,
+            "msa": morpheme.msa,
+            "language": morpheme.language,
+            "original_guid": morpheme.original_guid,
+        }
+
+        if morpheme.gloss:
+            gloss_id = f"gloss-morph-{morpheme.id}"
+            acc.morph_glosses[gloss_id] = {
+                "ID": gloss_id,
+                "target_id": morpheme.id,
+                "annotation": morpheme.gloss,
+            }
+
+
+def _run_unwind(tx, query: str, rows: List[Dict[str, Any]]) -> None:
+    """Run an ``UNWIND $rows`` query over rows in batches of UPLOAD_BATCH_SIZE"""
+    for start in range(0, len(rows), UPLOAD_BATCH_SIZE):
+        tx.run(query, rows=rows[start : start + UPLOAD_BATCH_SIZE])
+
+
+def _write_flattened_text(flat: _FlattenedText, tx) -> None:
+    """Persist a flattened text with one UNWIND query per node/relationship kind
+
+    Very large texts are split into batches so no single statement has to
+    carry an unbounded parameter list.
+    """
+    _run_unwind(
+        tx,
         """
-        MATCH (t:Text {ID: $text_id})
-        MERGE (s:Section {ID: $ID})
+        UNWIND $rows AS row
+        MATCH (t:Text {ID: row.text_id})
+        MERGE (s:Section {ID: row.ID})
           ON CREATE SET s.created_at = datetime()
-        SET s.order = $order,
+        SET s.order = row.order,
             s.updated_at = datetime()
         MERGE (t)-[:SECTION_PART_OF_TEXT]->(s)
         """,
-        text_id=text_id,
-        ID=section.id,
-        order=section.order,
+        flat.sections,
     )
 
-    # Store phrases with PHRASE_IN_SECTION relationship
-    for phrase in section.phrases:
-        await _store_phrase(phrase, section.id, db)
-
-    # Store words with SECTION_CONTAINS relationship
-    for word in section.words:
-        await _store_word_in_section(word, section.id, db)
-
-
-async def _store_phrase(phrase: PhraseCreate, section_id: str, db):
-    """Store a Phrase node with PHRASE_IN_SECTION relationship"""
-
-    # Create Phrase node and link to Section in one query to avoid Cartesian products
-    db.run(
+    _run_unwind(
+        tx,
         """
-        MATCH (s:Section {ID: $section_id})
-        MERGE (p:Phrase {ID: $ID})
+        UNWIND $rows AS row
+        MATCH (s:Section {ID: row.section_id})
+        MERGE (p:Phrase {ID: row.ID})
           ON CREATE SET p.created_at = datetime()
-        SET p.segnum = $segnum,
-            p.surface_text = $surface_text,
-            p.language = $language,
+        SET p.segnum = row.segnum,
+            p.surface_text = row.surface_text,
+            p.language = row.language,
             p.updated_at = datetime()
         MERGE (s)-[:PHRASE_IN_SECTION]->(p)
         """,
-        section_id=section_id,
-        ID=phrase.id,
-        segnum=phrase.segnum,
-        surface_text=phrase.surface_text,
-        language=phrase.language,
+        flat.phrases,
     )
 
-    # Store words in phrase with PHRASE_COMPOSED_OF relationship (includes Order property)
-    for idx, word in enumerate(phrase.words):
-        await _store_word_in_phrase(word, phrase.id, idx, db)
-
-
-async def _store_word_in_section(word: WordCreate, section_id: str, db):
-    """Store word with SECTION_CONTAINS relationship"""
-
-    # Create Word node and link to Section - avoid Cartesian products
-    # Convert pos list to string for storage (or handle as list if Neo4j supports it)
-    pos_value = ",".join(word.pos) if isinstance(word.pos, list) else word.pos
-
-    db.run(
+    _run_unwind(
+        tx,
         """
-        MATCH (s:Section {ID: $section_id})
-        MERGE (w:Word {ID: $ID})
+        UNWIND $rows AS row
+        MERGE (w:Word {ID: row.ID})
           ON CREATE SET w.created_at = datetime()
-        SET w.surface_form = $surface_form,
-            w.gloss = $gloss,
-            w.pos = $pos,
-            w.language = $language,
+        SET w.surface_form = row.surface_form,
+            w.gloss = row.gloss,
+            w.pos = row.pos,
+            w.language = row.language,
             w.updated_at = datetime()
-        MERGE (s)-[:SECTION_CONTAINS]->(w)
         """,
-        section_id=section_id,
-        ID=word.id,
-        surface_form=word.surface_form,
-        gloss=word.gloss,
-        pos=pos_value,
-        language=word.language,
+        list(flat.words.values()),
     )
 
-    # Store morphemes
-    for morpheme in word.morphemes:
-        await _store_morpheme(morpheme, word.id, db)
-
-    # Create Gloss node if word has gloss annotation
-    if word.gloss:
-        await _store_gloss_for_word(word.id, word.gloss, db)
-
-
-async def _store_word_in_phrase(word: WordCreate, phrase_id: str, order: int, db):
-    """Store word with PHRASE_COMPOSED_OF relationship (with Order property)"""
-
-    # Create Word node and link to Phrase - avoid Cartesian products
-    # Convert pos list to string for storage
-    pos_value = ",".join(word.pos) if isinstance(word.pos, list) else word.pos
-
-    db.run(
+    _run_unwind(
+        tx,
         """
-        MATCH (p:Phrase {ID: $phrase_id})
-        MERGE (w:Word {ID: $ID})
-          ON CREATE SET w.created_at = datetime()
-        SET w.surface_form = $surface_form,
-            w.gloss = $gloss,
-            w.pos = $pos,
-            w.language = $language,
-            w.updated_at = datetime()
-        MERGE (p)-[:PHRASE_COMPOSED_OF {Order: $order}]->(w)
+        UNWIND $rows AS row
+        MATCH (s:Section {ID: row.section_id})
+        MATCH (w:Word {ID: row.word_id})
+        MERGE (s)-[:SECTION_CONTAINS]->(w)
         """,
-        phrase_id=phrase_id,
-        ID=word.id,
-        order=order,
-        surface_form=word.surface_form,
-        gloss=word.gloss,
-        pos=pos_value,
-        language=word.language,
+        flat.word_in_section_edges,
     )
 
-    # Store morphemes
-    for morpheme in word.morphemes:
-        await _store_morpheme(morpheme, word.id, db)
-
-    # Create Gloss node if word has gloss annotation
-    if word.gloss:
-        await _store_gloss_for_word(word.id, word.gloss, db)
-
-
-async def _store_morpheme(morpheme: MorphemeCreate, word_id: str, db):
-    """Store a Morpheme node with WORD_MADE_OF relationship"""
-
-    # Convert msa to string if it's a dict or list
-    msa_value = morpheme.msa
-    if isinstance(morpheme.msa, dict):
-        msa_value = ",".join(f"{k}:{v}" for k, v in morpheme.msa.items())
-    elif isinstance(morpheme.msa, list):
-        msa_value = ",".join(morpheme.msa)
+    _run_unwind(
+        tx,
+        """
+        UNWIND $rows AS row
+        MATCH (p:Phrase {ID: row.phrase_id})
+        MATCH (w:Word {ID: row.word_id})
+        MERGE (p)-[:PHRASE_COMPOSED_OF {Order: row.order}]->(w)
+        """,
+        flat.word_in_phrase_edges,
+    )
 
-    db.run(
+    _run_unwind(
+        tx,
         """
-        MATCH (w:Word {ID: $word_id})
-        MERGE (m:Morpheme {ID: $ID})
+        UNWIND $rows AS row
+        MATCH (w:Word {ID: row.word_id})
+        MERGE (m:Morpheme {ID: row.ID})
           ON CREATE SET m.created_at = datetime()
-        SET m.type = $type,
-            m.surface_form = $surface_form,
-            m.citation_form = $citation_form,
-            m.gloss = $gloss,
-            m.msa = $msa,
-            m.language = $language,
-            m.original_guid = $original_guid,
+        SET m.type = row.type,
+            m.surface_form = row.surface_form,
+            m.citation_form = row.citation_form,
+            m.gloss = row.gloss,
+            m.msa = row.msa,
+            m.language = row.language,
+            m.original_guid = row.original_guid,
             m.updated_at = datetime()
         MERGE (w)-[:WORD_MADE_OF]->(m)
         """,
-        word_id=word_id,
-        ID=morpheme.id,
-        type=morpheme.type.value,
-        surface_form=morpheme.surface_form,
-        citation_form=morpheme.citation_form,
-        gloss=morpheme.gloss,
-        msa=str(msa_value),
-        language=morpheme.language,
-        original_guid=morpheme.original_guid,
+        list(flat.morphemes.values()),
     )
 
-    # Create Gloss node if morpheme has gloss
-    if morpheme.gloss:
-        await _store_gloss_for_morpheme(morpheme.id, morpheme.gloss, db)
-
-
-async def _store_gloss_for_word(word_id: str, annotation: str, db):
-    """Create a Gloss node linked to a Word with ANALYZES relationship"""
-
-    gloss_id = f"gloss-word-{word_id}"
-
-    db.run(
+    _run_unwind(
+        tx,
         """
-        MATCH (w:Word {ID: $word_id})
-        MERGE (g:Gloss {ID: $gloss_id})
+        UNWIND $rows AS row
+        MATCH (w:Word {ID: row.target_id})
+        MERGE (g:Gloss {ID: row.ID})
           ON CREATE SET g.created_at = datetime()
-        SET g.annotation = $annotation,
+        SET g.annotation = row.annotation,
             g.gloss_type = 'word',
             g.language = 'en',
             g.updated_at = datetime()
         MERGE (g)-[:ANALYZES]->(w)
         """,
-        word_id=word_id,
-        gloss_id=gloss_id,
-        annotation=annotation,
+        list(flat.word_glosses.values()),
     )
 
-
-async def _store_gloss_for_morpheme(morpheme_id: str, annotation: str, db):
-    """Create a Gloss node linked to a Morpheme with ANALYZES relationship"""
-
-    gloss_id = f"gloss-morph-{morpheme_id}"
-
-    db.run(
+    _run_unwind(
+        tx,
         """
-        MATCH (m:Morpheme {ID: $morpheme_id})
-        MERGE (g:Gloss {ID: $gloss_id})
+        UNWIND $rows AS row
+        MATCH (m:Morpheme {ID: row.target_id})
+        MERGE (g:Gloss {ID: row.ID})
           ON CREATE SET g.created_at = datetime()
-        SET g.annotation = $annotation,
+        SET g.annotation = row.annotation,
             g.gloss_type = 'morpheme',
             g.language = 'en',
             g.updated_at = datetime()
         MERGE (g)-[:ANALYZES]->(m)
         """,
-        morpheme_id=morpheme_id,
-        gloss_id=gloss_id,
-        annotation=annotation,
+        list(flat.morph_glosses.values()),
     )
 
 
-@router.post("/search/words", response_model=List[WordResponse])
-async def search_words(
-    query: WordSearchQuery, response: Response, db=Depends(get_db_dependency)
-):
+@router.post(
+    "/search/words", response_model=List[WordResponse], response_class=ORJSONResponse
+)
+async def search_words(query: WordSearchQuery, db=Depends(get_read_db_dependency)):
     """Search for words based on various criteria"""
     try:
-        base = ["MATCH (w:Word)"]
-        params = {}
-        conditions = []
-
-        if query.surface_form:
-            conditions.append("w.surface_form CONTAINS $surface_form")
-            params["surface_form"] = query.surface_form
-
-        if query.gloss:
-            conditions.append("w.gloss CONTAINS $gloss")
-            params["gloss"] = query.gloss
-
-        if query.pos:
-            conditions.append("w.pos = $pos")
-            params["pos"] = query.pos
-
-        if query.language:
-            conditions.append("w.language = $language")
-            params["language"] = query.language
-
-        if query.contains_morpheme:
-            base.append("MATCH (w)-[:WORD_MADE_OF]->(m:Morpheme)")
-            conditions.append(
-                "(m.surface_form CONTAINS $morpheme OR m.citation_form CONTAINS $morpheme)"
-            )
-            params["morpheme"] = query.contains_morpheme
-
-        where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+        # Empty strings disable a filter just like missing ones
+        params = {
+            "surface_form": query.surface_form or None,
+            "gloss": query.gloss or None,
+            "pos": query.pos or None,
+            "language": query.language or None,
+            "contains_morpheme": query.contains_morpheme or None,
+        }
 
-        count_cypher = (
-            "".join(base) + where_clause + " RETURN count(DISTINCT w) AS total"
+        record = db.run(
+            WORD_SEARCH_CYPHER, **params, limit=query.limit, offset=query.offset
+        ).single()
+
+        # Validated and serialized in one pydantic-core pass, so the body
+        # matches the declared response_model without FastAPI revalidating it
+        rows = WORD_SEARCH_ROWS.validate_python(record["rows"])
+        return Response(
+            content=WORD_SEARCH_ROWS.dump_json(rows, by_alias=True),
+            media_type="application/json",
+            headers={
+                "X-Total-Count": str(record["total"]),
+                "X-Limit": str(query.limit),
+                "X-Offset": str(query.offset),
+            },
         )
-        total = db.run(count_cypher, **params).single()["total"]
-
-        cypher_query = (
-            "".join(base)
-            + where_clause
-            + """
-            OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m2:Morpheme)
-            WITH w, COUNT(m2) AS morpheme_count
-            RETURN w.ID as ID, w.surface_form as surface_form,
-                   w.gloss as gloss, w.pos as pos, w.language as language,
-                   morpheme_count, toString(w.created_at) as created_at
-            ORDER BY w.surface_form
-            SKIP $offset
-            LIMIT $limit
-        """
-        )
-        params.update({"limit": query.limit, "offset": query.offset})
-
-        result = db.run(cypher_query, **params)
-        words = [WordResponse(**dict(record)) for record in result]
-
-        response.headers["X-Total-Count"] = str(total)
-        response.headers["X-Limit"] = str(query.limit)
-        response.headers["X-Offset"] = str(query.offset)
-
-        return words
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/search/morphemes", response_model=List[MorphemeResponse])
+@router.post(
+    "/search/morphemes",
+    response_model=List[MorphemeResponse],
+    response_class=ORJSONResponse,
+)
 async def search_morphemes(
-    query: MorphemeSearchQuery, response: Response, db=Depends(get_db_dependency)
+    query: MorphemeSearchQuery, db=Depends(get_read_db_dependency)
 ):
     """Search for morphemes based on various criteria"""
     try:
-        base = ["MATCH (m:Morpheme)"]
-        params = {}
-        conditions = []
-
-        if query.surface_form:
-            conditions.append("m.surface_form CONTAINS $surface_form")
-            params["surface_form"] = query.surface_form
-
-        if query.citation_form:
-            conditions.append("m.citation_form CONTAINS $citation_form")
-            params["citation_form"] = query.citation_form
-
-        if query.gloss:
-            conditions.append("m.gloss CONTAINS $gloss")
-            params["gloss"] = query.gloss
-
-        if query.type:
-            conditions.append("m.type = $type")
-            params["type"] = query.type.value
-
-        if query.language:
-            conditions.append("m.language = $language")
-            params["language"] = query.language
-
-        where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+        # Empty strings disable a filter just like missing ones
+        params = {
+            "surface_form": query.surface_form or None,
+            "citation_form": query.citation_form or None,
+            "gloss": query.gloss or None,
+            "type": query.type.value if query.type else None,
+            "language": query.language or None,
+        }
 
-        count_cypher = (
-            "".join(base) + where_clause + " RETURN count(DISTINCT m) AS total"
+        record = db.run(
+            MORPHEME_SEARCH_CYPHER, **params, limit=query.limit, offset=query.offset
+        ).single()
+
+        rows = MORPHEME_SEARCH_ROWS.validate_python(record["rows"])
+        return Response(
+            content=MORPHEME_SEARCH_ROWS.dump_json(rows, by_alias=True),
+            media_type="application/json",
+            headers={
+                "X-Total-Count": str(record["total"]),
+                "X-Limit": str(query.limit),
+                "X-Offset": str(query.offset),
+            },
         )
-        total = db.run(count_cypher, **params).single()["total"]
-
-        cypher_query = (
-            "".join(base)
-            + where_clause
-            + """
-            RETURN m.ID as ID, m.type as type,
-                   m.surface_form as surface_form, m.citation_form as citation_form,
-                   m.gloss as gloss, m.msa as msa, m.language as language,
-                   toString(m.created_at) as created_at
-            ORDER BY m.citation_form
-            SKIP $offset
-            LIMIT $limit
-        """
-        )
-        params.update({"limit": query.limit, "offset": query.offset})
-
-        result = db.run(cypher_query, **params)
-        morphemes = [MorphemeResponse(**dict(record)) for record in result]
-
-        response.headers["X-Total-Count"] = str(total)
-        response.headers["X-Limit"] = str(query.limit)
-        response.headers["X-Offset"] = str(query.offset)
-
-        return morphemes
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/concordance", response_model=List[ConcordanceResult])
+def _concordance_row(record) -> Dict[str, Any]:
+    """Shape a concordance record like ConcordanceResult"""
+    return {
+        "target": record["target"],
+        "left_context": record["left_context"],
+        "right_context": record["right_context"],
+        "phrase_id": record["phrase_id"],
+        "text_title": record["text_title"],
+        "segnum": record["segnum"],
+        "word_index": record["word_index"],
+        "token_span": None,
+        "glosses": record["glosses"] or None,
+    }
+
+
+@router.post(
+    "/concordance",
+    response_model=List[ConcordanceResult],
+    response_class=ORJSONResponse,
+)
 async def concordance_search(
-    query: ConcordanceQuery, response: Response, db=Depends(get_db_dependency)
+    query: ConcordanceQuery, db=Depends(get_read_db_dependency)
 ):
     """Concordance search: find patterns across texts with context window (KWIC format)"""
     try:
-        results = []
-
+        # Each hit's context window is cut from its phrase words in the same
+        # query (after the LIMIT, so only returned rows are expanded) instead
+        # of one context query per hit
+        cypher_query = None
         if query.target_type == GlossTarget.MORPHEME:
             # Search for morphemes matching the pattern
             # First, find all matching morphemes and their words
@@ -648,73 +957,39 @@ async def concordance_search(
             ORDER BY word_order
             OPTIONAL MATCH (g:Gloss)-[:ANALYZES]->(m)
             WITH ph, w, m, word_order, t, s, collect(DISTINCT g.annotation) as glosses
-            RETURN 
-                ph.ID as phrase_id,
+            WITH
+                ph,
                 COALESCE(t.title, '') as text_title,
                 COALESCE(s.ID, '') as segnum,
                 m.surface_form as target,
-                word_order as word_index,
+                word_order,
                 [g IN glosses WHERE g IS NOT NULL] as glosses
-            ORDER BY t.title, segnum, word_order
+            ORDER BY text_title, segnum, word_order
             LIMIT $limit
-            """
-
-            params = {
-                "target": query.target,
-                "language": query.language,
-                "limit": query.limit,
-            }
-
-            result = db.run(cypher_query, **params)
-            for record in result:
-                # Get context words for this phrase
-                phrase_id = record["phrase_id"]
-                word_order = record["word_index"]
-
-                # Get all words in the phrase for context
-                context_query = """
-                MATCH (ph:Phrase {ID: $phrase_id})-[r:PHRASE_COMPOSED_OF]->(w:Word)
-                WITH w, r.Order as order
+            CALL {
+                WITH ph, word_order
+                MATCH (ph)-[rc:PHRASE_COMPOSED_OF]->(cw:Word)
+                WITH word_order, rc.Order as order, cw.surface_form as surface_form
                 ORDER BY order
-                RETURN collect(w.surface_form) as words, collect(order) as orders
-                """
-                context_result = db.run(context_query, phrase_id=phrase_id).single()
-
-                if context_result:
-                    words = context_result["words"] or []
-                    orders = context_result["orders"] or []
-                    try:
-                        target_idx = orders.index(word_order)
-                        left_context = (
-                            words[max(0, target_idx - query.context_size) : target_idx]
-                            if target_idx > 0
-                            else []
-                        )
-                        right_context = (
-                            words[target_idx + 1 : target_idx + 1 + query.context_size]
-                            if target_idx < len(words) - 1
-                            else []
-                        )
-                    except ValueError:
-                        left_context = []
-                        right_context = []
-                else:
-                    left_context = []
-                    right_context = []
-
-                glosses = record.get("glosses") or []
-                results.append(
-                    ConcordanceResult(
-                        target=record["target"],
-                        left_context=left_context,
-                        right_context=right_context,
-                        phrase_id=phrase_id,
-                        text_title=record["text_title"],
-                        segnum=record["segnum"],
-                        word_index=word_order,
-                        glosses=glosses if glosses else None,
-                    )
-                )
+                WITH word_order, collect({order: order, surface_form: surface_form}) as phrase_words
+                WITH
+                    [x IN phrase_words WHERE x.order < word_order | x.surface_form] as left_words,
+                    [x IN phrase_words WHERE x.order > word_order | x.surface_form] as right_words
+                RETURN
+                    reverse(reverse(left_words)[..$context_size]) as left_context,
+                    right_words[..$context_size] as right_context
+            }
+            RETURN
+                ph.ID as phrase_id,
+                text_title,
+                segnum,
+                target,
+                word_order as word_index,
+                glosses,
+                left_context,
+                right_context
+            ORDER BY text_title, segnum, word_index
+            """
 
         elif query.target_type == GlossTarget.WORD:
             # Search for words matching the pattern
@@ -728,134 +1003,109 @@ async def concordance_search(
             ORDER BY word_order
             OPTIONAL MATCH (g:Gloss)-[:ANALYZES]->(w)
             WITH ph, w, word_order, t, s, collect(DISTINCT g.annotation) as glosses
-            RETURN 
-                ph.ID as phrase_id,
+            WITH
+                ph,
                 COALESCE(t.title, '') as text_title,
                 COALESCE(s.ID, '') as segnum,
                 w.surface_form as target,
-                word_order as word_index,
+                word_order,
                 [g IN glosses WHERE g IS NOT NULL] as glosses
-            ORDER BY t.title, segnum, word_order
+            ORDER BY text_title, segnum, word_order
             LIMIT $limit
-            """
-
-            params = {
-                "target": query.target,
-                "language": query.language,
-                "limit": query.limit,
+            CALL {
+                WITH ph, word_order
+                MATCH (ph)-[rc:PHRASE_COMPOSED_OF]->(cw:Word)
+                WITH word_order, rc.Order as order, cw.surface_form as surface_form
+                ORDER BY order
+                WITH word_order, collect({order: order, surface_form: surface_form}) as phrase_words
+                WITH
+                    [x IN phrase_words WHERE x.order < word_order | x.surface_form] as left_words,
+                    [x IN phrase_words WHERE x.order > word_order | x.surface_form] as right_words
+                RETURN
+                    reverse(reverse(left_words)[..$context_size]) as left_context,
+                    right_words[..$context_size] as right_context
             }
+            RETURN
+                ph.ID as phrase_id,
+                text_title,
+                segnum,
+                target,
+                word_order as word_index,
+                glosses,
+                left_context,
+                right_context
+            ORDER BY text_title, segnum, word_index
+            """
 
-            result = db.run(cypher_query, **params)
-            for record in result:
-                # Get context words for this phrase
-                phrase_id = record["phrase_id"]
-                word_order = record["word_index"]
-
-                # Get all words in the phrase for context
-                context_query = """
-                MATCH (ph:Phrase {ID: $phrase_id})-[r:PHRASE_COMPOSED_OF]->(w:Word)
-                WITH w, r.Order as order
-                ORDER BY order
-                RETURN collect(w.surface_form) as words, collect(order) as orders
-                """
-                context_result = db.run(context_query, phrase_id=phrase_id).single()
-
-                if context_result:
-                    words = context_result["words"] or []
-                    orders = context_result["orders"] or []
-                    try:
-                        target_idx = orders.index(word_order)
-                        left_context = (
-                            words[max(0, target_idx - query.context_size) : target_idx]
-                            if target_idx > 0
-                            else []
-                        )
-                        right_context = (
-                            words[target_idx + 1 : target_idx + 1 + query.context_size]
-                            if target_idx < len(words) - 1
-                            else []
-                        )
-                    except ValueError:
-                        left_context = []
-                        right_context = []
-                else:
-                    left_context = []
-                    right_context = []
-
-                glosses = record.get("glosses") or []
-                results.append(
-                    ConcordanceResult(
-                        target=record["target"],
-                        left_context=left_context,
-                        right_context=right_context,
-                        phrase_id=phrase_id,
-                        text_title=record["text_title"],
-                        segnum=record["segnum"],
-                        word_index=word_order,
-                        glosses=glosses if glosses else None,
-                    )
-                )
+        headers = {"X-Total-Count": "0", "X-Limit": str(query.limit)}
+        if not cypher_query:
+            return ORJSONResponse(content=[], headers=headers)
 
-        total = len(results)
-        response.headers["X-Total-Count"] = str(total)
-        response.headers["X-Limit"] = str(query.limit)
+        params = {
+            "target": query.target,
+            "language": query.language,
+            "limit": query.limit,
+            "context_size": query.context_size,
+        }
 
-        return results
+        records = db.run(cypher_query, **params)
+        rows = [_concordance_row(record) for record in records]
+        headers["X-Total-Count"] = str(len(rows))
+        return ORJSONResponse(content=rows, headers=headers)
 
     except Exception as e:
-        logger.error(f"Error in concordance search: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error in concordance search: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/texts", response_model=List[InterlinearTextResponse])
+@router.get(
+    "/texts",
+    response_model=List[InterlinearTextResponse],
+    response_class=ORJSONResponse,
+)
 async def get_texts(
     language: Optional[str] = None,
     skip: int = 0,
     limit: int = 50,
+    after_created_at: Optional[str] = None,
+    after_id: Optional[str] = None,
     response: Response = None,
-    db=Depends(get_db_dependency),
+    db=Depends(get_read_db_dependency),
 ):
-    """Get list of interlinear texts"""
-    try:
-        total = db.run(
-            """
-            MATCH (t:Text)
-            WHERE ($language IS NULL OR t.language = $language)
-            RETURN count(t) AS total
-            """,
-            language=language,
-        ).single()["total"]
-
-        cypher_query = """
-            MATCH (t:Text)
-            WHERE ($language IS NULL OR t.language = $language)
-            OPTIONAL MATCH (t)-[:SECTION_PART_OF_TEXT]->(s:Section)
-            OPTIONAL MATCH (s)-[:SECTION_CONTAINS]->(w:Word)
-            OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m:Morpheme)
-            WITH t, 
-                 COUNT(DISTINCT s) AS section_count,
-                 COUNT(DISTINCT w) AS word_count,
-                 COUNT(DISTINCT m) AS morpheme_count
-            RETURN
-              COALESCE(t.ID, toString(id(t)))                     AS ID,
-              COALESCE(t.title, '')                               AS title,
-              COALESCE(t.source, '')                              AS source,
-              COALESCE(t.comment, '')                             AS comment,
-              COALESCE(t.language, '')                       AS language,
-              section_count, word_count, morpheme_count,
-              toString(COALESCE(t.created_at, datetime()))        AS created_at
-            ORDER BY COALESCE(t.created_at, datetime()) DESC
-            SKIP $skip
-            LIMIT $limit
-        """
-        result = db.run(cypher_query, language=language, skip=skip, limit=limit)
+    """Get list of interlinear texts
 
-        texts = [InterlinearTextResponse(**dict(record)) for record in result]
+    Pass the X-Next-Cursor header of a page back as its query string
+    (after_created_at/after_id) to fetch the next page by keyset instead of
+    by offset.
+    """
+    try:
+        cache_key = ("texts", language, skip, limit, after_created_at, after_id)
+        cached = read_cache.get(cache_key)
+        if cached is None:
+            record = db.run(
+                TEXT_LIST_CYPHER,
+                language=language,
+                skip=skip,
+                limit=limit,
+                after_created_at=after_created_at,
+                after_id=after_id,
+            ).single()
+            cached = (record["total"], tuple(record["rows"]), record["last_cursor"])
+            read_cache.set(cache_key, cached)
+
+        total, rows, last_cursor = cached
+        texts = [InterlinearTextResponse(**row) for row in rows]
 
         response.headers["X-Total-Count"] = str(total)
         response.headers["X-Limit"] = str(limit)
         response.headers["X-Offset"] = str(skip)
+        if rows and len(rows) == limit:
+            # The sort values rather than the row's created_at, which reads
+            # as "now" for texts stored without one
+            last_created_at, last_id = last_cursor
+            response.headers["X-Next-Cursor"] = urlencode(
+                {"after_created_at": last_created_at, "after_id": last_id}
+            )
 
         return texts
 
@@ -863,53 +1113,51 @@ async def get_texts(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/stats")
-async def get_database_stats(db=Depends(get_db_dependency)):
-    """Get overall database statistics"""
-    try:
-        # Use separate queries to avoid timeout issues
-        text_count = (
-            db.run("MATCH (t:Text) RETURN count(t) as count").single()["count"] or 0
-        )
-        section_count = (
-            db.run("MATCH (s:Section) RETURN count(s) as count").single()["count"] or 0
-        )
-        phrase_count = (
-            db.run("MATCH (p:Phrase) RETURN count(p) as count").single()["count"] or 0
-        )
-        word_count = (
-            db.run("MATCH (w:Word) RETURN count(w) as count").single()["count"] or 0
-        )
-        morpheme_count = (
-            db.run("MATCH (m:Morpheme) RETURN count(m) as count").single()["count"] or 0
-        )
-        gloss_count = (
-            db.run("MATCH (g:Gloss) RETURN count(g) as count").single()["count"] or 0
-        )
+def _read_database_stats(db) -> Dict[str, int]:
+    """Node counts per label plus the relationship count"""
+    global _apoc_meta_stats_available
 
-        # Count relationships - this can be expensive, so we'll make it optional
+    if _apoc_meta_stats_available is not False:
         try:
-            relationship_count = (
-                db.run("MATCH ()-[r]->() RETURN count(r) as count").single()["count"]
-                or 0
-            )
-        except Exception:
-            # If counting all relationships times out, estimate or skip
-            relationship_count = None
+            record = db.run(STATS_APOC_QUERY).single()
+        except ClientError as e:
+            if e.code != "Neo.ClientError.Procedure.ProcedureNotFound":
+                raise
+            logger.warning("APOC not available, counting /stats with Cypher")
+            _apoc_meta_stats_available = False
+        else:
+            _apoc_meta_stats_available = True
+            labels = record["labels"]
+            stats = {
+                f"{label.lower()}_count": labels.get(label, 0)
+                for label in STATS_NODE_LABELS
+            }
+            stats["relationship_count"] = record["relCount"]
+            return stats
 
-        return {
-            "text_count": text_count,
-            "section_count": section_count,
-            "phrase_count": phrase_count,
-            "word_count": word_count,
-            "morpheme_count": morpheme_count,
-            "gloss_count": gloss_count,
-            "relationship_count": relationship_count,
-        }
+    record = db.run(STATS_NODE_COUNTS_QUERY).single()
+    stats = {key: value or 0 for key, value in record.items()}
+    stats["relationship_count"] = (
+        db.run(STATS_RELATIONSHIP_COUNT_QUERY).single()["count"] or 0
+    )
+    return stats
+
+
+@router.get("/stats")
+async def get_database_stats(db=Depends(get_read_db_dependency)):
+    """Get overall database statistics"""
+    cached_body = read_cache.get("stats")
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+
+    try:
+        stats = _read_database_stats(db)
+        response = ORJSONResponse(content=stats)
+        read_cache.set("stats", response.body)
+        return response
 
     except Exception as e:
-        logger.error(f"Error fetching stats: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error fetching stats: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 
@@ -928,36 +1176,50 @@ async def get_schema_visualization(db=Depends(get_db_dependency)):
 
 
 @router.get("/graph-filters")
-async def get_graph_filters(db=Depends(get_db_dependency)):
+async def get_graph_filters(db=Depends(get_read_db_dependency)):
     """Get available filter options for graph visualization"""
+    cached_body = read_cache.get("graph-filters")
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+
     try:
-        # Get available texts
-        texts_query = """
-            MATCH (t:Text)
-            RETURN t.ID as id, 
-                   COALESCE(t.title, t.ID, 'Untitled') as title,
-                   t.language as language
-            ORDER BY t.title
-            LIMIT 50
-        """
-        texts_result = db.run(texts_query)
-        texts = [dict(record) for record in texts_result]
-
-        # Get available languages
-        languages_query = """
-            MATCH (t:Text)
-            WHERE t.language IS NOT NULL
-            RETURN DISTINCT t.language as code
-            ORDER BY code
+        # Available texts and languages are independent lookups, fetched as
+        # two subqueries of one statement. Texts are projected to maps, which
+        # the driver hands back as dicts.
+        filters_query = """
+            CALL {
+                MATCH (t:Text)
+                WITH t
+                ORDER BY t.title
+                LIMIT 50
+                RETURN collect({
+                    id: t.ID,
+                    title: COALESCE(t.title, t.ID, 'Untitled'),
+                    language: t.language
+                }) AS texts
+            }
+            CALL {
+                MATCH (t:Text)
+                WHERE t.language IS NOT NULL
+                WITH DISTINCT t.language AS code
+                ORDER BY code
+                RETURN collect(code) AS languages
+            }
+            RETURN texts, languages
         """
-        lang_result = db.run(languages_query)
-        languages = [record["code"] for record in lang_result if record["code"]]
-
-        return {
-            "texts": texts,
-            "languages": languages,
-            "node_types": ["Text", "Section", "Phrase", "Word", "Morpheme", "Gloss"],
-        }
+        record = db.run(filters_query).single()
+        texts = record["texts"]
+        languages = [code for code in record["languages"] if code]
+
+        response = ORJSONResponse(
+            content={
+                "texts": texts,
+                "languages": languages,
+                "node_types": ["Text", "Section", "Phrase", "Word", "Morpheme", "Gloss"],
+            }
+        )
+        read_cache.set("graph-filters", response.body)
+        return response
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -968,7 +1230,7 @@ async def get_graph_data(
     language: Optional[str] = None,
     node_types: Optional[str] = None,  # Comma-separated: "Text,Word,Gloss"
     limit: int = GRAPH_DATA_DEFAULT_LIMIT,
-    db=Depends(get_db_dependency),
+    db=Depends(get_read_db_dependency),
 ):
     """Get graph data for visualization with nodes and edges
 
@@ -980,263 +1242,171 @@ async def get_graph_data(
     """
     limit = max(GRAPH_DATA_MIN_LIMIT, min(limit, GRAPH_DATA_MAX_LIMIT))
 
-    # Helper class for creating record objects
-    class GraphRecord:
-        def __init__(self, nodes, edges):
-            self.data = {"allNodes": nodes, "allEdges": edges}
-
-        def __getitem__(self, key):
-            return self.data[key]
+    cache_key = (text_id, language, node_types, limit)
+    cached_body = graph_data_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
 
     try:
         nodes = []
         edges = []
 
-        # Query to get all nodes and relationships
+        # Nodes and the relationships between them come back in one record.
         # If text_id is provided, filter by that text, otherwise get a sample
         if text_id:
-            # Much simpler query - get nodes and edges separately
-            # First get all nodes related to this text
-            cypher_query = """
-                MATCH path = (t:Text {ID: $text_id})-[*0..3]->(n)
-                WITH DISTINCT n as node
-                LIMIT $limit
-                RETURN collect(node) as allNodes
-            """
-
-            nodes_result = db.run(cypher_query, text_id=text_id, limit=limit * 5)
-            nodes_record = nodes_result.single()
-
-            if not nodes_record or not nodes_record["allNodes"]:
-                return {"nodes": [], "edges": []}
-
-            all_node_objects = nodes_record["allNodes"]
-            node_ids = [node.id for node in all_node_objects if node is not None]
-
-            # Now get edges between these nodes
-            edges_query = """
-                MATCH (n1)-[r]->(n2)
-                WHERE id(n1) IN $node_ids AND id(n2) IN $node_ids
-                RETURN collect({
-                    source: id(n1),
-                    target: id(n2),
-                    type: type(r)
-                }) as allEdges
-            """
-            edges_result = db.run(edges_query, node_ids=node_ids)
-            edges_record = edges_result.single()
-
-            all_edges = edges_record["allEdges"] if edges_record else []
-
-            # Create a record structure for compatibility with rest of code
-            record = GraphRecord(all_node_objects, all_edges)
+            # Get all nodes related to this text
+            query = GRAPH_TEXT_QUERY
+            params = {"text_id": text_id, "limit": limit * 5}
         else:
             # Parse node types filter - use simple query to get sample nodes
             allowed_types = set()
             if node_types:
                 allowed_types = set(t.strip() for t in node_types.split(","))
 
-            # Get sample nodes of each type separately (much simpler and faster)
-            all_node_objects = []
-
-            if not node_types or "Text" in allowed_types:
-                lang_filter = "WHERE t.language = $language" if language else ""
-                query = f"MATCH (t:Text) {lang_filter} RETURN t LIMIT $limit"
-                result = db.run(query, limit=limit, language=language)
-                all_node_objects.extend([record["t"] for record in result])
-
-            if not node_types or "Section" in allowed_types:
-                query = "MATCH (s:Section) RETURN s LIMIT $limit"
-                result = db.run(query, limit=limit)
-                all_node_objects.extend([record["s"] for record in result])
-
-            if not node_types or "Phrase" in allowed_types:
-                query = "MATCH (ph:Phrase) RETURN ph LIMIT $limit"
-                result = db.run(query, limit=limit)
-                all_node_objects.extend([record["ph"] for record in result])
-
-            if not node_types or "Word" in allowed_types:
-                lang_filter = "WHERE w.language = $language" if language else ""
-                query = f"MATCH (w:Word) {lang_filter} RETURN w LIMIT $limit"
-                result = db.run(query, limit=limit, language=language)
-                all_node_objects.extend([record["w"] for record in result])
-
-            if not node_types or "Morpheme" in allowed_types:
-                lang_filter = "WHERE m.language = $language" if language else ""
-                query = f"MATCH (m:Morpheme) {lang_filter} RETURN m LIMIT $limit"
-                result = db.run(query, limit=limit, language=language)
-                all_node_objects.extend([record["m"] for record in result])
-
-            if not node_types or "Gloss" in allowed_types:
-                query = "MATCH (g:Gloss) RETURN g LIMIT $limit"
-                result = db.run(query, limit=limit)
-                all_node_objects.extend([record["g"] for record in result])
-
-            if not all_node_objects:
+            labels = tuple(
+                label
+                for label in GRAPH_SAMPLE_LABELS
+                if not node_types or label in allowed_types
+            )
+            if not labels:
                 return {"nodes": [], "edges": []}
 
-            # Get node IDs for edge query
-            node_ids = [node.id for node in all_node_objects if node is not None]
-
-            # Get edges between these nodes (simple query)
-            edges_query = """
-                MATCH (n1)-[r]->(n2)
-                WHERE id(n1) IN $node_ids AND id(n2) IN $node_ids
-                RETURN collect({
-                    source: id(n1),
-                    target: id(n2),
-                    type: type(r)
-                }) as allEdges
-            """
-            edges_result = db.run(edges_query, node_ids=node_ids)
-            edges_record = edges_result.single()
+            query = _graph_sample_query(labels, bool(language))
+            params = {"limit": limit, "language": language}
 
-            all_edges = edges_record["allEdges"] if edges_record else []
-
-            # Create a record structure for compatibility with rest of code
-            record = GraphRecord(all_node_objects, all_edges)
+        # Nodes are projected to plain maps instead of returned as Node so
+        # the driver does not have to hydrate full graph entities
+        record = db.run(query, **params).single()
+        all_nodes = record["allNodes"]
 
-        if not record:
+        if not all_nodes:
             # Return empty graph if no data
             return {"nodes": [], "edges": []}
 
-        # Define colors for each node type
-        node_colors = {
-            "Text": "#f59e0b",  # amber
-            "Section": "#8b5cf6",  # purple
-            "Phrase": "#06b6d4",  # cyan
-            "Word": "#0ea5e9",  # blue
-            "Morpheme": "#10b981",  # green
-            "Gloss": "#ec4899",  # pink
-        }
-
-        # Define sizes for each node type (larger = more important in hierarchy)
-        node_sizes = {
-            "Text": 30,
-            "Section": 22,
-            "Phrase": 16,
-            "Word": 8,
-            "Morpheme": 6,
-            "Gloss": 7,
-        }
-
-        # Process nodes (track seen IDs to avoid duplicates)
-        all_nodes = record["allNodes"]
-        seen_node_ids = set()
+        get_color = NODE_COLORS.get
+        get_size = NODE_SIZES.get
+        nodes_append = nodes.append
 
+        # Process nodes (collected with DISTINCT, so each arrives once even if
+        # it carries more than one sampled label)
         for node in all_nodes:
-            if node is None:
-                continue
-
-            # Skip duplicates
-            node_id = str(node.id)
-            if node_id in seen_node_ids:
-                continue
-            seen_node_ids.add(node_id)
-
-            labels = list(node.labels)
-            if not labels:
+            node_type = node["type"]
+            if node_type is None:
                 continue
 
-            node_type = labels[0]
-            node_props = dict(node)
-
-            # Get label text
-            label_text = node_props.get("ID", "")
-            if node_type == "Text":
-                label_text = node_props.get("title", label_text)
-            elif node_type == "Word":
-                label_text = node_props.get("surface_form", label_text)
-            elif node_type == "Morpheme":
-                label_text = node_props.get(
-                    "surface_form", node_props.get("citation_form", label_text)
-                )
-            elif node_type == "Gloss":
-                label_text = node_props.get("annotation", label_text)[
-                    :20
-                ]  # Truncate long glosses
-            elif node_type == "Phrase":
-                label_text = node_props.get("surface_text", label_text)[:30]
-
-            nodes.append(
+            nodes_append(
                 {
-                    "id": node_id,
-                    "label": label_text,
+                    "id": node["id"],
+                    "label": node["label"],
                     "type": node_type,
-                    "color": node_colors.get(node_type, "#64748b"),
-                    "size": node_sizes.get(node_type, 10),
-                    "properties": node_props,
+                    "color": get_color(node_type, DEFAULT_NODE_COLOR),
+                    "size": get_size(node_type, DEFAULT_NODE_SIZE),
+                    "properties": node["props"],
                 }
             )
 
-        # Process edges
-        all_edges = record["allEdges"]
-        for idx, edge in enumerate(all_edges):
-            if edge is None or edge.get("source") is None or edge.get("target") is None:
-                continue
-
-            edges.append(
+        edges_append = edges.append
+        # source/target come from matched nodes, so they are never null
+        for idx, edge in enumerate(record["allEdges"]):
+            edges_append(
                 {
                     "id": f"edge-{idx}",
-                    "source": str(edge["source"]),
-                    "target": str(edge["target"]),
-                    "type": edge.get("type", ""),
+                    "source": edge["source"],
+                    "target": edge["target"],
+                    "type": edge["type"],
                     "size": 2,
                     "color": "#94a3b8",
                 }
             )
 
-        return {
-            "nodes": nodes,
-            "edges": edges,
-            "stats": {"node_count": len(nodes), "edge_count": len(edges)},
-        }
+        # Every value is already JSON-native, so hand the payload straight to
+        # orjson instead of letting FastAPI walk it with jsonable_encoder
+        response = ORJSONResponse(
+            content={
+                "nodes": nodes,
+                "edges": edges,
+                "stats": {"node_count": len(nodes), "edge_count": len(edges)},
+            }
+        )
+        graph_data_cache.set(cache_key, response.body)
+        return response
 
     except Exception as e:
-        logger.error(f"Error fetching graph data: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error fetching graph data: %s", e)
         raise HTTPException(
             status_code=400, detail=f"Error fetching graph data: {str(e)}"
         )
 
 
+def _delete_all_nodes(db) -> None:
+    """DETACH DELETE every node in bounded batches instead of one huge transaction"""
+    try:
+        record = db.run(
+            """
+            CALL apoc.periodic.iterate(
+              'MATCH (n) RETURN n',
+              'DETACH DELETE n',
+              {batchSize: $batch_size, parallel: false}
+            )
+            YIELD batches, failedBatches, errorMessages
+            RETURN batches, failedBatches, errorMessages
+            """,
+            batch_size=WIPE_BATCH_SIZE,
+        ).single()
+    except ClientError as e:
+        if e.code != "Neo.ClientError.Procedure.ProcedureNotFound":
+            raise
+        logger.warning("APOC not available, wiping with CALL IN TRANSACTIONS")
+        db.run(
+            """
+            MATCH (n)
+            CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF $batch_size ROWS
+            """,
+            batch_size=WIPE_BATCH_SIZE,
+        ).consume()
+        return
+
+    # apoc.periodic.iterate reports failed batches instead of raising, and
+    # their nodes are still in the database
+    if record["failedBatches"]:
+        raise RuntimeError(
+            f"{record['failedBatches']} of {record['batches']} delete batches failed: "
+            f"{record['errorMessages']}"
+        )
+
+
 @router.delete("/wipe-database")
-async def wipe_database(db=Depends(get_db_dependency)):
+async def wipe_database(report_counts: bool = False, db=Depends(get_db_dependency)):
     """Wipe all linguistic data from the database
 
     WARNING: This will permanently delete all texts, sections, phrases, words,
     morphemes, and glosses from the database. This action cannot be undone.
+
+    Args:
+        report_counts: Count the nodes and relationships before deleting them
+            and return them as ``deleted_counts`` (empty when not requested)
     """
     try:
-        # Delete all nodes and relationships in the correct order to avoid constraint violations
-        wipe_queries = [
-            # Delete all relationships first
-            "MATCH ()-[r]-() DELETE r",
-            # Delete all nodes
-            "MATCH (n) DELETE n",
-        ]
-
         deleted_counts = {}
+        if report_counts:
+            # Counts before deletion for reporting, from the same store
+            # statistics as /stats (a single apoc.meta.stats() call)
+            stats = _read_database_stats(db)
+            deleted_counts = {
+                "texts": stats["text_count"],
+                "sections": stats["section_count"],
+                "phrases": stats["phrase_count"],
+                "words": stats["word_count"],
+                "morphemes": stats["morpheme_count"],
+                "glosses": stats["gloss_count"],
+                "relationships": stats["relationship_count"],
+            }
 
-        # Get counts before deletion for reporting
-        count_queries = {
-            "texts": "MATCH (t:Text) RETURN count(t) as count",
-            "sections": "MATCH (s:Section) RETURN count(s) as count",
-            "phrases": "MATCH (p:Phrase) RETURN count(p) as count",
-            "words": "MATCH (w:Word) RETURN count(w) as count",
-            "morphemes": "MATCH (m:Morpheme) RETURN count(m) as count",
-            "glosses": "MATCH (g:Gloss) RETURN count(g) as count",
-            "relationships": "MATCH ()-[r]-() RETURN count(r) as count",
-        }
-
-        for entity_type, query in count_queries.items():
-            result = db.run(query)
-            record = result.single()
-            deleted_counts[entity_type] = record["count"] if record else 0
-
-        # Execute wipe queries
-        for query in wipe_queries:
-            db.run(query)
+        try:
+            _delete_all_nodes(db)
+        finally:
+            # Even a partly failed wipe has removed some nodes
+            _invalidate_read_caches()
 
         return {
             "message": "Database wiped successfully",
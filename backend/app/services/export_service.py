@@ -1,6 +1,6 @@
 """Service layer for exporting linguistic data from the database to FLEXText format."""
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Union
 from dataclasses import dataclass
 
 
@@ -73,15 +73,35 @@ async def fetch_text_for_export(text_id: str, db) -> Optional[TextExport]:
     Returns:
         TextExport with all nested data, or None if text not found
     """
-    # Fetch text metadata
+    # Fetch the whole text in one round trip. Each level is ordered before
+    # it is collected into its parent (sections by order, phrases by ID,
+    # words by PHRASE_COMPOSED_OF.Order, morphemes by ID), and projecting a
+    # missing node yields null, which collect() drops.
     text_query = """
         MATCH (t:Text {ID: $text_id})
-        RETURN 
-            t.ID AS ID,
-            t.title AS title,
-            t.source AS source,
-            t.comment AS comment,
-            t.language_code AS language_code
+        OPTIONAL MATCH (t)-[:SECTION_PART_OF_TEXT]->(s:Section)
+        OPTIONAL MATCH (s)-[:PHRASE_IN_SECTION]->(p:Phrase)
+        OPTIONAL MATCH (p)-[r:PHRASE_COMPOSED_OF]->(w:Word)
+        OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m:Morpheme)
+        WITH t, s, p, r, w, m
+        ORDER BY m.ID
+        WITH t, s, p, r, w, collect(m {
+            .ID, .type, .surface_form, .citation_form,
+            .gloss, .msa, .language, .original_guid
+        }) AS morphemes
+        ORDER BY r.Order
+        WITH t, s, p, collect(w {
+            .ID, .surface_form, .gloss, .pos, .language, morphemes: morphemes
+        }) AS words
+        ORDER BY p.ID
+        WITH t, s, collect(p {
+            .ID, .segnum, .surface_text, .language, words: words
+        }) AS phrases
+        ORDER BY s.order
+        WITH t, collect(s {.ID, .order, phrases: phrases}) AS sections
+        RETURN
+            t {.ID, .title, .source, .comment, .language_code} AS text,
+            sections
     """
     
     result = db.run(text_query, text_id=text_id)
@@ -90,190 +110,89 @@ async def fetch_text_for_export(text_id: str, db) -> Optional[TextExport]:
     if not record:
         return None
     
-    text_data = {
-        "ID": record["ID"],
-        "title": record.get("title") or "",
-        "source": record.get("source") or "",
-        "comment": record.get("comment") or "",
-        "language_code": record.get("language_code") or "unknown",
-    }
-    
-    # Fetch sections ordered by section.order
-    sections_query = """
-        MATCH (t:Text {ID: $text_id})-[:SECTION_PART_OF_TEXT]->(s:Section)
-        RETURN s.ID AS section_id, s.order AS section_order
-        ORDER BY s.order
-    """
-    
-    sections_result = db.run(sections_query, text_id=text_id)
-    sections_dict: Dict[str, SectionExport] = {}
-    
-    for record in sections_result:
-        section_id = record["section_id"]
-        section_order = record.get("section_order", 0)
-        sections_dict[section_id] = SectionExport(
-            ID=section_id,
-            order=section_order,
-            phrases=[]
-        )
-    
-    if not sections_dict:
-        # No sections found, return text with empty sections
-        return TextExport(
-            ID=text_data["ID"],
-            title=text_data["title"],
-            source=text_data["source"],
-            comment=text_data["comment"],
-            language_code=text_data["language_code"],
-            sections=[]
-        )
-    
-    # Fetch phrases for each section
-    phrases_query = """
-        MATCH (s:Section)-[:PHRASE_IN_SECTION]->(p:Phrase)
-        WHERE s.ID IN $section_ids
-        RETURN 
-            s.ID AS section_id,
-            p.ID AS phrase_id,
-            p.segnum AS phrase_segnum,
-            p.surface_text AS phrase_surface_text,
-            p.language AS phrase_language
-        ORDER BY s.ID, p.ID
-    """
-    
-    section_ids = list(sections_dict.keys())
-    phrases_result = db.run(phrases_query, section_ids=section_ids)
-    phrases_dict: Dict[str, PhraseExport] = {}
-    
-    for record in phrases_result:
-        section_id = record["section_id"]
-        phrase_id = record["phrase_id"]
-        
-        phrase = PhraseExport(
-            ID=phrase_id,
-            segnum=record.get("phrase_segnum") or "",
-            surface_text=record.get("phrase_surface_text") or "",
-            language=normalize_language_code(record.get("phrase_language")) or text_data["language_code"],
-            words=[],
-            order=len(sections_dict[section_id].phrases)
-        )
-        
-        phrases_dict[phrase_id] = phrase
-        phrase_section_map[phrase_id] = section_id
-        sections_dict[section_id].phrases.append(phrase)
-    
-    if not phrases_dict:
-        # No phrases found, return text with sections but no phrases
-        sections = sorted(sections_dict.values(), key=lambda s: s.order)
-        return TextExport(
-            ID=text_data["ID"],
-            title=text_data["title"],
-            source=text_data["source"],
-            comment=text_data["comment"],
-            language_code=text_data["language_code"],
-            sections=sections
-        )
-    
-    # Fetch words for each phrase with their order from PHRASE_COMPOSED_OF relationship
-    words_query = """
-        MATCH (p:Phrase)-[r:PHRASE_COMPOSED_OF]->(w:Word)
-        WHERE p.ID IN $phrase_ids
-        OPTIONAL MATCH (w)-[:WORD_MADE_OF]->(m:Morpheme)
-        WITH p, r, w, m
-        ORDER BY p.ID, r.Order, m.ID
-        RETURN 
-            p.ID AS phrase_id,
-            r.Order AS word_order,
-            w.ID AS word_id,
-            w.surface_form AS word_surface_form,
-            w.gloss AS word_gloss,
-            w.pos AS word_pos,
-            w.language AS word_language,
-            m.ID AS morph_id,
-            m.type AS morph_type,
-            m.surface_form AS morph_surface_form,
-            m.citation_form AS morph_citation_form,
-            m.gloss AS morph_gloss,
-            m.msa AS morph_msa,
-            m.language AS morph_language,
-            m.original_guid AS morph_original_guid
-    """
-    
-    phrase_ids = list(phrases_dict.keys())
-    words_result = db.run(words_query, phrase_ids=phrase_ids)
-    
-    words_dict: Dict[str, WordExport] = {}  # word_id -> word
-    phrase_word_order: Dict[str, List[tuple]] = {}  # phrase_id -> [(word_id, order)]
-    
-    for record in words_result:
-        phrase_id = record["phrase_id"]
-        word_id = record["word_id"]
-        word_order = record.get("word_order", 999)
-        
-        # Track word order in phrase
-        if phrase_id not in phrase_word_order:
-            phrase_word_order[phrase_id] = []
-        if word_id not in [wid for wid, _ in phrase_word_order[phrase_id]]:
-            phrase_word_order[phrase_id].append((word_id, word_order))
-        
-        # Create word if not exists
-        if word_id not in words_dict:
-            pos = record.get("word_pos") or ""
-            is_punct = pos.upper() == "PUNCT" or pos.lower() == "punct"
-            
-            phrase = phrases_dict[phrase_id]
-            word = WordExport(
-                ID=word_id,
-                surface_form=record.get("word_surface_form") or "",
-                gloss=record.get("word_gloss") or "",
-                pos=pos if not is_punct else "",
-                language=normalize_language_code(record.get("word_language")) or phrase.language,
-                morphemes=[],
-                is_punctuation=is_punct
-            )
-            words_dict[word_id] = word
-        
-        word = words_dict[word_id]
-        
-        # Handle morpheme
-        morph_id = record.get("morph_id")
-        if morph_id:
-            # Check if morpheme already added
-            if not any(m.ID == morph_id for m in word.morphemes):
-                morph = MorphemeExport(
-                    ID=morph_id,
-                    type=record.get("morph_type"),
-                    surface_form=record.get("morph_surface_form") or "",
-                    citation_form=record.get("morph_citation_form") or "",
-                    gloss=record.get("morph_gloss") or "",
-                    msa=record.get("morph_msa") or "",
-                    language=normalize_language_code(record.get("morph_language")) or word.language,
-                    original_guid=record.get("morph_original_guid"),
-                )
-                word.morphemes.append(morph)
-    
-    # Add words to phrases in correct order
-    for phrase_id, phrase in phrases_dict.items():
-        if phrase_id in phrase_word_order:
-            # Sort by word_order
-            ordered_words = sorted(phrase_word_order[phrase_id], key=lambda x: x[1])
-            for word_id, _ in ordered_words:
-                if word_id in words_dict:
-                    phrase.words.append(words_dict[word_id])
-    
-    # Sort sections by order
-    sections = sorted(sections_dict.values(), key=lambda s: s.order)
+    text_data = record["text"]
+    text_language = text_data.get("language_code") or "unknown"
     
     return TextExport(
         ID=text_data["ID"],
-        title=text_data["title"],
-        source=text_data["source"],
-        comment=text_data["comment"],
-        language_code=text_data["language_code"],
-        sections=sections
+        title=text_data.get("title") or "",
+        source=text_data.get("source") or "",
+        comment=text_data.get("comment") or "",
+        language_code=text_language,
+        sections=[
+            _build_section(section_data, text_language)
+            for section_data in record["sections"]
+        ]
+    )
+
+
+# Builders for the nested maps returned by fetch_text_for_export's query.
+# Every level already arrives ordered, so they only convert and fill in the
+# inherited language.
+
+def _build_section(section_data: dict, text_language: str) -> SectionExport:
+    return SectionExport(
+        ID=section_data["ID"],
+        order=section_data.get("order") or 0,
+        phrases=[
+            _build_phrase(phrase_data, order, text_language)
+            for order, phrase_data in enumerate(section_data["phrases"])
+        ]
+    )
+
+
+def _build_phrase(phrase_data: dict, order: int, text_language: str) -> PhraseExport:
+    phrase_language = normalize_language_code(phrase_data.get("language")) or text_language
+    return PhraseExport(
+        ID=phrase_data["ID"],
+        segnum=phrase_data.get("segnum") or "",
+        surface_text=phrase_data.get("surface_text") or "",
+        language=phrase_language,
+        words=[_build_word(word_data, phrase_language) for word_data in phrase_data["words"]],
+        order=order
     )
 
 
+def _build_word(word_data: dict, phrase_language: str) -> WordExport:
+    pos = join_pos_tags(word_data.get("pos")) or ""
+    is_punct = pos.upper() == "PUNCT" or pos.lower() == "punct"
+    
+    word_language = normalize_language_code(word_data.get("language")) or phrase_language
+    return WordExport(
+        ID=word_data["ID"],
+        surface_form=word_data.get("surface_form") or "",
+        gloss=word_data.get("gloss") or "",
+        pos=pos if not is_punct else "",
+        language=word_language,
+        morphemes=[_build_morpheme(morph, word_language) for morph in word_data["morphemes"]],
+        is_punctuation=is_punct
+    )
+
+
+def _build_morpheme(morph: dict, word_language: str) -> MorphemeExport:
+    return MorphemeExport(
+        ID=morph["ID"],
+        type=morph.get("type"),
+        surface_form=morph.get("surface_form") or "",
+        citation_form=morph.get("citation_form") or "",
+        gloss=morph.get("gloss") or "",
+        msa=morph.get("msa") or "",
+        language=normalize_language_code(morph.get("language")) or word_language,
+        original_guid=morph.get("original_guid"),
+    )
+
+
+def join_pos_tags(pos: Union[List[str], str, None]) -> Optional[str]:
+    """Return a Word's POS as the comma-joined string used in exports.
+    
+    Word.pos is stored as a list of tags; data written before that change
+    (and not yet migrated) still holds an "A,B" string, returned as is.
+    """
+    if isinstance(pos, list):
+        return ",".join(pos)
+    return pos
+
+
 def normalize_language_code(code: Optional[str]) -> Optional[str]:
     """Normalize language code for FLEXText export.
     
@@ -2,15 +2,35 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import hashlib
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence
+
+import orjson
+
+from app.core.cache import TTLCache
+from app.services.export_service import join_pos_tags
 
 GraphData = Dict[str, Any]
 
+# Word POS tags that mark punctuation rather than a lexical word
+_PUNCT_POS = frozenset(("PUNCT", "PUNCTUATION", "SYM"))
+
+
+# Assembled graph data per text, keyed on the text's cache-key row (see
+# _TEXT_CACHE_KEY) so a re-uploaded text misses. Values are orjson bytes and
+# each hit is decoded into fresh dicts, so callers never share mutable
+# payloads. Upload and wipe clear it via linguistic._invalidate_read_caches().
+TEXT_GRAPH_CACHE_TTL_SECONDS = 300
+text_graph_cache = TTLCache(maxsize=128, ttl=TEXT_GRAPH_CACHE_TTL_SECONDS)
+
 
 class Neo4jExportDataError(RuntimeError):
     """Raised when graph data required for export cannot be assembled."""
 
 
+# Called for every node's language, which takes only a handful of values
+@lru_cache(maxsize=1024)
 def _normalize_language_code(value: Any) -> str | None:
     if value is None:
         return None
@@ -18,6 +38,71 @@ def _normalize_language_code(value: Any) -> str | None:
     return text or None
 
 
+# Query texts are fixed, parameterized module constants so Neo4j can reuse
+# their cached plans. The ``db`` sessions passed in are not thread-safe; use
+# one per request/thread.
+
+# Everything below a matched Text ``t``, as one row per text: each level is
+# ordered (by its order property, then ID) and collected into its parent as a
+# map, so the lists arrive sorted. Projecting a missing (OPTIONAL MATCH) node
+# yields null, which collect() drops; DISTINCT drops repeated morphemes.
+_TEXT_HIERARCHY = """
+    OPTIONAL MATCH (t)-[:SECTION_PART_OF_TEXT]->(s:Section)
+    OPTIONAL MATCH (s)-[:PHRASE_IN_SECTION]->(p:Phrase)
+    OPTIONAL MATCH (p)-[r:PHRASE_COMPOSED_OF]->(w:Word)
+    OPTIONAL MATCH (w)-[rm:WORD_MADE_OF]->(m:Morpheme)
+    WITH t, s, p, r, w, rm, m
+    ORDER BY rm.Order, m.ID
+    WITH t, s, p, r, w, collect(DISTINCT m {
+        id: m.ID,
+        order: rm.Order,
+        .type, .surface_form, .citation_form, .gloss, .msa, .language,
+        original_id: m.original_guid
+    }) AS morphemes
+    ORDER BY r.Order, w.ID
+    WITH t, s, p, collect(w {
+        id: w.ID,
+        order: r.Order,
+        .surface_form, .gloss, .pos, .language,
+        morphemes: morphemes
+    }) AS words
+    ORDER BY p.order, p.ID
+    WITH t, s, collect(p {
+        id: p.ID,
+        .order, .segnum, .surface_text, .language,
+        words: words
+    }) AS phrases
+    ORDER BY s.order, s.ID
+    WITH t, collect(s {id: s.ID, .order, phrases: phrases}) AS sections
+    RETURN t {id: t.ID, .title, .source, .comment, .language_code} AS text,
+           sections
+"""
+
+# The given texts' hierarchies in one round trip, one row per text
+_TEXTS_GRAPH_QUERY = (
+    "UNWIND $text_ids AS text_id MATCH (t:Text {ID: text_id})" + _TEXT_HIERARCHY
+)
+
+# Everything an export reads from a Text, as a list. Uploads MERGE the Text,
+# so a re-upload bumps updated_at (title, source, comment and language are
+# rewritten), while children are only written when the text is first
+# created; a wipe removes texts. Any change to a text's export output
+# therefore changes its key.
+_TEXT_CACHE_KEY = "[t.ID, toString(t.created_at), toString(t.updated_at)]"
+
+_TEXT_KEY_QUERY = f"""
+    MATCH (t:Text {{ID: $text_id}})
+    RETURN {_TEXT_CACHE_KEY} AS key
+"""
+
+# Keys of every Text with an ID (texts are looked up and exported by ID)
+_ALL_TEXT_KEYS_QUERY = f"""
+    MATCH (t:Text) WHERE t.ID IS NOT NULL
+    WITH t ORDER BY t.ID
+    RETURN collect({_TEXT_CACHE_KEY}) AS keys
+"""
+
+
 def get_file_graph_data(file_id: str, db) -> GraphData:
     """Fetch the linguistic hierarchy for the given file/dataset from Neo4j.
 
@@ -30,20 +115,46 @@ def get_file_graph_data(file_id: str, db) -> GraphData:
         and morphemes suitable for downstream XML generation.
     """
 
-    text_query = """
-        MATCH (t:Text {ID: $text_id})
-        RETURN t.ID AS id,
-               t.title AS title,
-               t.source AS source,
-               t.comment AS comment,
-               t.language_code AS language_code
-    """
-
-    text_result = db.run(text_query, text_id=file_id)
-    text_record = text_result.single()
-    if not text_record:
+    record = db.run(_TEXT_KEY_QUERY, text_id=file_id).single()
+    graph_data = _cached_graph_data(db, [record["key"]]) if record else []
+    if not graph_data:
         raise Neo4jExportDataError(f"No Text node found for id '{file_id}'")
 
+    return graph_data[0]
+
+
+def _cached_graph_data(db, keys: Sequence[Sequence[Any]]) -> List[GraphData]:
+    """Graph data for the texts with the given cache keys, in key order.
+
+    Only texts missing from ``text_graph_cache`` are fetched, in one query.
+    """
+    cache_keys = [tuple(key) for key in keys]
+    payloads: Dict[str, bytes] = {}
+    for cache_key in cache_keys:
+        cached = text_graph_cache.get(cache_key)
+        if cached is not None:
+            payloads[cache_key[0]] = cached
+
+    missing = [cache_key for cache_key in cache_keys if cache_key[0] not in payloads]
+    if missing:
+        keys_by_id = {cache_key[0]: cache_key for cache_key in missing}
+        for record in db.run(_TEXTS_GRAPH_QUERY, text_ids=list(keys_by_id)):
+            payload = orjson.dumps(_graph_data_from_record(record))
+            text_id = record["text"]["id"]
+            payloads[text_id] = payload
+            text_graph_cache.set(keys_by_id[text_id], payload)
+
+    return [
+        orjson.loads(payloads[cache_key[0]])
+        for cache_key in cache_keys
+        if cache_key[0] in payloads
+    ]
+
+
+def _graph_data_from_record(record) -> GraphData:
+    """Turn one text row of ``_TEXT_HIERARCHY`` into the export payload."""
+
+    text_record = record["text"]
     text_data = {
         "id": text_record["id"],
         "title": text_record.get("title"),
@@ -53,171 +164,90 @@ def get_file_graph_data(file_id: str, db) -> GraphData:
         or "unknown",
     }
 
-    sections_query = """
-        MATCH (t:Text {ID: $text_id})-[:SECTION_PART_OF_TEXT]->(s:Section)
-        RETURN s.ID AS id,
-               s.order AS order
-        ORDER BY order, id
-    """
-
-    sections_result = db.run(sections_query, text_id=file_id)
-
     sections: List[Dict[str, Any]] = []
-    section_map: Dict[str, Dict[str, Any]] = {}
-
-    for index, record in enumerate(sections_result):
-        section_id = record["id"]
-        order_value = record.get("order")
-        section_data = {
-            "id": section_id,
-            "order": order_value if order_value is not None else index,
-            "phrases": [],
-        }
-        sections.append(section_data)
-        section_map[section_id] = section_data
-
-    if not sections:
-        return {"text": text_data, "sections": []}
-
-    section_ids = list(section_map.keys())
-
-    phrases_query = """
-        MATCH (s:Section)-[:PHRASE_IN_SECTION]->(p:Phrase)
-        WHERE s.ID IN $section_ids
-        RETURN s.ID AS section_id,
-               p.ID AS id,
-               p.segnum AS segnum,
-               p.surface_text AS surface_text,
-               p.language AS language,
-               p.order AS order
-        ORDER BY section_id, order, id
-    """
 
-    phrases_result = db.run(phrases_query, section_ids=section_ids)
-
-    phrase_map: Dict[str, Dict[str, Any]] = {}
-
-    for index, record in enumerate(phrases_result):
-        section_id = record["section_id"]
-        if section_id not in section_map:
-            continue
-
-        phrase_id = record["id"]
-        order_value = record.get("order")
-        phrase_data = {
-            "id": phrase_id,
-            "order": order_value if order_value is not None else index,
-            "segnum": record.get("segnum"),
-            "surface_text": record.get("surface_text"),
-            "language": _normalize_language_code(record.get("language"))
-            or text_data["language_code"],
-            "words": [],
-        }
-
-        section_map[section_id]["phrases"].append(phrase_data)
-        phrase_map[phrase_id] = phrase_data
-
-    if not phrase_map:
-        return {"text": text_data, "sections": sections}
-
-    phrase_ids = list(phrase_map.keys())
-
-    words_query = """
-        MATCH (p:Phrase)-[r:PHRASE_COMPOSED_OF]->(w:Word)
-        WHERE p.ID IN $phrase_ids
-        OPTIONAL MATCH (w)-[rm:WORD_MADE_OF]->(m:Morpheme)
-        RETURN p.ID AS phrase_id,
-               w.ID AS word_id,
-               r.Order AS word_order,
-               w.surface_form AS word_surface_form,
-               w.gloss AS word_gloss,
-               w.pos AS word_pos,
-               w.language AS word_language,
-               m.ID AS morph_id,
-               rm.Order AS morph_order,
-               m.type AS morph_type,
-               m.surface_form AS morph_surface_form,
-               m.citation_form AS morph_citation_form,
-               m.gloss AS morph_gloss,
-               m.msa AS morph_msa,
-               m.language AS morph_language,
-               m.original_guid AS morph_original_guid
-        ORDER BY phrase_id, word_order, morph_order
-    """
-
-    words_result = db.run(words_query, phrase_ids=phrase_ids)
-
-    word_map: Dict[str, Dict[str, Any]] = {}
-    phrase_word_orders: Dict[str, List[Dict[str, Any]]] = {
-        phrase_id: phrase["words"] for phrase_id, phrase in phrase_map.items()
-    }
-
-    for record in words_result:
-        phrase_id = record["phrase_id"]
-        if phrase_id not in phrase_map:
-            continue
-
-        word_id = record["word_id"]
-        if word_id is None:
-            continue
-
-        word_order = record.get("word_order")
-        if word_id not in word_map:
-            pos_value = record.get("word_pos")
-            is_punctuation = False
-            if pos_value:
-                pos_upper = str(pos_value).upper()
-                is_punctuation = pos_upper in {"PUNCT", "PUNCTUATION", "SYM"}
-
-            word_data = {
-                "id": word_id,
-                "order": word_order if word_order is not None else len(phrase_word_orders[phrase_id]),
-                "surface_form": record.get("word_surface_form"),
-                "gloss": record.get("word_gloss"),
-                "pos": None if is_punctuation else record.get("word_pos"),
-                "language": _normalize_language_code(record.get("word_language"))
-                or phrase_map[phrase_id]["language"],
-                "is_punctuation": is_punctuation,
-                "morphemes": [],
+    for section_index, section_record in enumerate(record["sections"]):
+        order_value = section_record.get("order")
+        phrases: List[Dict[str, Any]] = []
+        sections.append(
+            {
+                "id": section_record["id"],
+                "order": order_value if order_value is not None else section_index,
+                "phrases": phrases,
             }
+        )
 
-            phrase_word_orders[phrase_id].append(word_data)
-            word_map[word_id] = word_data
-
-        word_data = word_map[word_id]
-
-        morph_id = record.get("morph_id")
-        if not morph_id or word_data["is_punctuation"]:
-            continue
-
-        morph_order = record.get("morph_order")
-        morphemes = word_data["morphemes"]
-
-        if not any(morph.get("id") == morph_id for morph in morphemes):
-            morphemes.append(
+        for phrase_index, phrase_record in enumerate(section_record["phrases"]):
+            order_value = phrase_record.get("order")
+            phrase_language = (
+                _normalize_language_code(phrase_record.get("language"))
+                or text_data["language_code"]
+            )
+            words: List[Dict[str, Any]] = []
+            phrases.append(
                 {
-                    "id": morph_id,
-                    "order": morph_order if morph_order is not None else len(morphemes),
-                    "type": record.get("morph_type"),
-                    "surface_form": record.get("morph_surface_form"),
-                    "citation_form": record.get("morph_citation_form"),
-                    "gloss": record.get("morph_gloss"),
-                    "msa": record.get("morph_msa"),
-                    "language": _normalize_language_code(record.get("morph_language"))
-                    or word_data["language"],
-                    "original_id": record.get("morph_original_guid"),
+                    "id": phrase_record["id"],
+                    "order": order_value if order_value is not None else phrase_index,
+                    "segnum": phrase_record.get("segnum"),
+                    "surface_text": phrase_record.get("surface_text"),
+                    "language": phrase_language,
+                    "words": words,
                 }
             )
 
-    # Ensure deterministic ordering for downstream processing
-    for section in sections:
-        section["phrases"].sort(key=lambda p: (p.get("order", 0), p.get("id", "")))
-        for phrase in section["phrases"]:
-            phrase["words"].sort(key=lambda w: (w.get("order", 0), w.get("id", "")))
-            for word in phrase["words"]:
-                word["morphemes"].sort(key=lambda m: (m.get("order", 0), m.get("id", "")))
-
-    sections.sort(key=lambda s: (s.get("order", 0), s.get("id", "")))
+            for word_record in phrase_record["words"]:
+                word_id = word_record["id"]
+                if word_id is None:
+                    continue
+
+                pos_value = join_pos_tags(word_record.get("pos"))
+                # Stored tags are normally upper case already; only fold on a miss
+                is_punctuation = bool(pos_value) and (
+                    pos_value in _PUNCT_POS or pos_value.upper() in _PUNCT_POS
+                )
+
+                word_order = word_record.get("order")
+                word_language = (
+                    _normalize_language_code(word_record.get("language"))
+                    or phrase_language
+                )
+                morphemes: List[Dict[str, Any]] = []
+                words.append(
+                    {
+                        "id": word_id,
+                        "order": word_order if word_order is not None else len(words),
+                        "surface_form": word_record.get("surface_form"),
+                        "gloss": word_record.get("gloss"),
+                        "pos": None if is_punctuation else pos_value,
+                        "language": word_language,
+                        "is_punctuation": is_punctuation,
+                        "morphemes": morphemes,
+                    }
+                )
+
+                if is_punctuation:
+                    continue
+
+                for morph_record in word_record["morphemes"]:
+                    morph_id = morph_record.get("id")
+                    if not morph_id:
+                        continue
+
+                    morph_order = morph_record.get("order")
+                    morphemes.append(
+                        {
+                            "id": morph_id,
+                            "order": morph_order if morph_order is not None else len(morphemes),
+                            "type": morph_record.get("type"),
+                            "surface_form": morph_record.get("surface_form"),
+                            "citation_form": morph_record.get("citation_form"),
+                            "gloss": morph_record.get("gloss"),
+                            "msa": morph_record.get("msa"),
+                            "language": _normalize_language_code(morph_record.get("language"))
+                            or word_language,
+                            "original_id": morph_record.get("original_id"),
+                        }
+                    )
 
     return {
         "text": text_data,
@@ -228,30 +258,16 @@ def get_file_graph_data(file_id: str, db) -> GraphData:
 def get_all_texts_graph_data(db) -> List[GraphData]:
     """Return graph data for every Text node in the database."""
 
-    text_ids_query = """
-        MATCH (t:Text)
-        RETURN COALESCE(t.ID, toString(id(t))) AS id
-        ORDER BY id
-    """
-
-    result = db.run(text_ids_query)
-
-    graph_payloads: List[GraphData] = []
-    seen_ids: set[str] = set()
-
-    for record in result:
-        text_id = record.get("id")
-        if not text_id or text_id in seen_ids:
-            continue
-
-        try:
-            graph_data = get_file_graph_data(text_id, db)
-        except Neo4jExportDataError:
-            continue
-
-        graph_payloads.append(graph_data)
-        seen_ids.add(text_id)
+    keys = db.run(_ALL_TEXT_KEYS_QUERY).single()["keys"]
+    return _cached_graph_data(db, keys)
 
-    return graph_payloads
 
+def get_export_fingerprint(db) -> str:
+    """Return a short hash identifying the current state of exportable texts."""
 
+    keys = db.run(_ALL_TEXT_KEYS_QUERY).single()["keys"]
+    digest = hashlib.md5()
+    for key in keys:
+        digest.update("|".join(str(value) for value in key).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
@@ -1,5 +1,7 @@
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
 from contextlib import asynccontextmanager
 import os
@@ -10,7 +12,7 @@ load_dotenv()
 
 # Import routers
 from app.routers import auth, languages, documentation, linguistic, export
-from app.database import init_neo4j, close_neo4j
+from app.database import init_neo4j, close_neo4j, apply_schema
 from app.core.config import settings
 
 
@@ -19,9 +21,21 @@ async def lifespan(app: FastAPI):
     # Startup
     print("Starting up Lexiconnect API...")
     init_neo4j()
+    try:
+        apply_schema()
+    except Exception as e:
+        # Queries still work without the indexes, just slower
+        print(f"Warning: could not apply Neo4j schema: {e}")
     yield
     # Shutdown
     print("Shutting down Lexiconnect API...")
+    # Hit/miss counts show whether the in-process read caches pay off
+    print(
+        "Cache stats: "
+        f"graph_data={linguistic.graph_data_cache.stats()} "
+        f"reads={linguistic.read_cache.stats()} "
+        f"export={export.export_cache.stats()}"
+    )
     close_neo4j()
 
 
@@ -30,6 +44,8 @@ app = FastAPI(
     description="IGT-first, graph-native tool for endangered/minority language documentation and research",
     version="1.0.0",
     lifespan=lifespan,
+    # Serialize responses with orjson unless a route says otherwise
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -41,6 +57,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (graph JSON is highly repetitive)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["authentication"])
 app.include_router(languages.router, prefix="/api/v1/languages", tags=["languages"])
@@ -822,9 +822,12 @@ export default function GraphVisualization() {
   const handleWipeDatabase = async () => {
     setIsWiping(true);
     try {
-      const response = await fetch("/api/v1/linguistic/wipe-database", {
-        method: "DELETE",
-      });
+      const response = await fetch(
+        "/api/v1/linguistic/wipe-database?report_counts=true",
+        {
+          method: "DELETE",
+        }
+      );
 
       if (!response.ok) {
         throw new Error("Failed to wipe database");
@@ -0,0 +1,53 @@
+"""Tests for the in-process response cache."""
+
+import os
+import sys
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
+
+from app.core import cache as cache_module  # noqa: E402
+from app.core.cache import TTLCache  # noqa: E402
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    cache = TTLCache(maxsize=4, ttl=30)
+    cache.set("key", b"payload")
+    assert cache.get("key") == b"payload"
+
+    now[0] += 31
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_clear():
+    cache = TTLCache()
+    cache.set("key", "value")
+    cache.clear()
+    assert cache.get("key", "missing") == "missing"
+
+
+def test_ttl_cache_counts_hits_and_misses():
+    cache = TTLCache()
+    cache.get("key")
+    cache.set("key", "value")
+    cache.get("key")
+    cache.get("key")
+
+    assert cache.stats() == {"hits": 2, "misses": 1, "size": 1}
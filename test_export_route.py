@@ -13,7 +13,10 @@ from fastapi.testclient import TestClient
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
 
 from main import app  # noqa: E402  # isort:skip
-from app.database import get_db_dependency  # noqa: E402  # isort:skip
+from app.database import get_read_db_dependency  # noqa: E402  # isort:skip
+from app.routers.export import export_cache  # noqa: E402  # isort:skip
+from app.routers.linguistic import _invalidate_read_caches  # noqa: E402  # isort:skip
+from app.services.neo4j_service import text_graph_cache  # noqa: E402  # isort:skip
 
 
 class _StubSession:
@@ -32,7 +35,7 @@ def _override_get_db():  # pragma: no cover - simple generator
 def test_export_flextext_returns_valid_xml_attachment():
     """POST /api/v1/export/flextext should return an XML attachment."""
 
-    app.dependency_overrides[get_db_dependency] = _override_get_db
+    app.dependency_overrides[get_read_db_dependency] = _override_get_db
 
     fake_graphs = [{"text": {"id": "text-123"}, "sections": []}]
     fake_payload = (
@@ -51,7 +54,9 @@ def test_export_flextext_returns_valid_xml_attachment():
         return_value=fake_graphs,
     ) as mocked_graphs, patch(
         "app.routers.export.get_exporter", return_value=stub_exporter
-    ) as mocked_get_exporter:
+    ) as mocked_get_exporter, patch(
+        "app.routers.export.get_export_fingerprint", return_value="xml-fingerprint"
+    ):
         try:
             client = TestClient(app)
             response = client.post(
@@ -60,7 +65,7 @@ def test_export_flextext_returns_valid_xml_attachment():
                 json={"file_id": "test-dataset"},
             )
         finally:
-            app.dependency_overrides.pop(get_db_dependency, None)
+            app.dependency_overrides.pop(get_read_db_dependency, None)
 
     mocked_get_exporter.assert_called_once_with("flextext")
     mocked_graphs.assert_called_once_with(ANY)
@@ -78,7 +83,7 @@ def test_export_flextext_returns_valid_xml_attachment():
 
 
 def test_export_json_returns_valid_attachment():
-    app.dependency_overrides[get_db_dependency] = _override_get_db
+    app.dependency_overrides[get_read_db_dependency] = _override_get_db
 
     fake_graphs = [{"text": {"id": "text-123"}, "sections": []}]
     fake_payload = "{\"texts\": []}"
@@ -95,7 +100,9 @@ def test_export_json_returns_valid_attachment():
     ) as mocked_graphs, patch(
         "app.routers.export.get_exporter",
         return_value=stub_exporter,
-    ) as mocked_get_exporter:
+    ) as mocked_get_exporter, patch(
+        "app.routers.export.get_export_fingerprint", return_value="json-fingerprint"
+    ):
         try:
             client = TestClient(app)
             response = client.post(
@@ -104,7 +111,7 @@ def test_export_json_returns_valid_attachment():
                 json={"file_id": "dataset"},
             )
         finally:
-            app.dependency_overrides.pop(get_db_dependency, None)
+            app.dependency_overrides.pop(get_read_db_dependency, None)
 
     mocked_get_exporter.assert_called_once_with("json")
     mocked_graphs.assert_called_once_with(ANY)
@@ -115,3 +122,51 @@ def test_export_json_returns_valid_attachment():
     assert "dataset.json" in response.headers.get("content-disposition", "")
     assert response.json() == json.loads(fake_payload)
 
+
+def test_export_reuses_cached_body_until_fingerprint_changes():
+    app.dependency_overrides[get_read_db_dependency] = _override_get_db
+    export_cache.clear()
+
+    stub_exporter = MagicMock()
+    stub_exporter.file_type = "flextext"
+    stub_exporter.media_type = "application/xml"
+    stub_exporter.file_extension = "flextext"
+    stub_exporter.export.return_value = "<document />"
+
+    with patch(
+        "app.routers.export.get_all_texts_graph_data",
+        return_value=[{"text": {"id": "text-123"}, "sections": []}],
+    ) as mocked_graphs, patch(
+        "app.routers.export.get_exporter", return_value=stub_exporter
+    ), patch(
+        "app.routers.export.get_export_fingerprint",
+        side_effect=["fingerprint-1", "fingerprint-1", "fingerprint-2"],
+    ):
+        try:
+            client = TestClient(app)
+            first = client.post("/api/v1/export", json={"file_id": "one"})
+            # A different download name is served from the cached body
+            second = client.post("/api/v1/export", json={"file_id": "two"})
+            # Changed data (e.g. a re-uploaded text) is exported afresh
+            third = client.post("/api/v1/export", json={"file_id": "one"})
+        finally:
+            app.dependency_overrides.pop(get_read_db_dependency, None)
+            export_cache.clear()
+
+    assert first.status_code == second.status_code == third.status_code == 200
+    assert second.content == first.content
+    assert "two.flextext" in second.headers.get("content-disposition", "")
+    assert second.headers["etag"] == first.headers["etag"]
+    assert third.headers["etag"] != first.headers["etag"]
+
+    assert mocked_graphs.call_count == 2
+    assert stub_exporter.export.call_count == 2
+
+
+def test_graph_writes_clear_the_export_cache():
+    export_cache.set(("flextext", "fingerprint"), b"<document />")
+    text_graph_cache.set(("text-1", "created", "updated"), b"{}")
+    _invalidate_read_caches()
+
+    assert len(export_cache) == 0
+    assert len(text_graph_cache) == 0
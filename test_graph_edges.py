@@ -128,7 +128,7 @@ def test_gloss_relationships():
         if analyzes_count == 0:
             print("❌ PROBLEM: No ANALYZES relationships found!")
             print("   This means glosses are not being linked to words/morphemes.")
-            print("   Check the _store_gloss_for_word() and _store_gloss_for_morpheme() functions.")
+            print("   Check the gloss rows emitted by _flatten_word() in the upload writer.")
         elif gloss_word_count == 0 and gloss_morph_count == 0:
             print("❌ PROBLEM: ANALYZES relationships exist but not to Word/Morpheme!")
             print(f"   Total ANALYZES: {analyzes_count}, but 0 to Word and 0 to Morpheme")
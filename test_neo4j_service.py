@@ -6,15 +6,27 @@ import os
 import sys
 from typing import Any, Dict, Iterable
 
+import pytest
+
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
 
 from app.services.neo4j_service import (  # noqa: E402
     Neo4jExportDataError,
+    get_all_texts_graph_data,
+    get_export_fingerprint,
     get_file_graph_data,
+    text_graph_cache,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_text_graph_cache():
+    text_graph_cache.clear()
+    yield
+    text_graph_cache.clear()
+
+
 class _FakeResult:
     def __init__(self, records: Iterable[Dict[str, Any]]):
         self._records = list(records)
@@ -26,112 +38,136 @@ class _FakeResult:
         return iter(self._records)
 
 
+def _morpheme(morph_id, order, surface_form, gloss, msa):
+    return {
+        "id": morph_id,
+        "order": order,
+        "type": "stem",
+        "surface_form": surface_form,
+        "citation_form": surface_form,
+        "gloss": gloss,
+        "msa": msa,
+        "language": "eng",
+        "original_id": None,
+    }
+
+
 class _FakeSession:
-    def __init__(self):
+    def __init__(self, updated_at: str = "2024-01-02T00:00:00Z"):
+        self.updated_at = updated_at
         self.last_query = None
         self.last_params = None
+        self.query_count = 0
+        self.graph_query_count = 0
+
+    def _key(self, text_id: str):
+        return [text_id, "2024-01-01T00:00:00Z", self.updated_at]
 
     def run(self, query: str, **params):
         self.last_query = query
         self.last_params = params
+        self.query_count += 1
 
-        if "SECTION_PART_OF_TEXT" in query:
+        if "AS keys" in query:
             return _FakeResult(
-                [
-                    {"id": "section-2", "order": 2},
-                    {"id": "section-1", "order": 1},
-                ]
+                [{"keys": [self._key("text-a"), self._key("text-b")]}]
             )
 
-        if "PHRASE_IN_SECTION" in query:
-            return _FakeResult(
-                [
-                    {
-                        "section_id": "section-1",
-                        "id": "phrase-1",
-                        "segnum": "1",
-                        "surface_text": "hello world",
-                        "language": "eng",
-                        "order": 1,
-                    },
-                    {
-                        "section_id": "section-2",
-                        "id": "phrase-2",
-                        "segnum": "2",
-                        "surface_text": "second phrase",
-                        "language": None,
-                        "order": 5,
-                    },
-                ]
-            )
+        if "AS key" in query:
+            return _FakeResult([{"key": self._key(params["text_id"])}])
 
-        if "PHRASE_COMPOSED_OF" in query:
+        if "UNWIND $text_ids" in query:
+            self.graph_query_count += 1
+
+        if "UNWIND $text_ids" in query and params["text_ids"] == ["text-123"]:
+            # Rows arrive in the order the query's ORDER BY clauses produce
             return _FakeResult(
                 [
                     {
-                        "phrase_id": "phrase-1",
-                        "word_id": "word-1",
-                        "word_order": 2,
-                        "word_surface_form": "hello",
-                        "word_gloss": "HEL",
-                        "word_pos": "N",
-                        "word_language": "eng",
-                        "morph_id": "morph-1",
-                        "morph_order": 1,
-                        "morph_type": "stem",
-                        "morph_surface_form": "hello",
-                        "morph_citation_form": "hello",
-                        "morph_gloss": "HEL",
-                        "morph_msa": "n",
-                        "morph_language": "eng",
-                    },
-                    {
-                        "phrase_id": "phrase-1",
-                        "word_id": "word-2",
-                        "word_order": 3,
-                        "word_surface_form": ".",
-                        "word_gloss": None,
-                        "word_pos": "PUNCT",
-                        "word_language": None,
-                        "morph_id": None,
-                        "morph_order": None,
-                        "morph_type": None,
-                        "morph_surface_form": None,
-                        "morph_citation_form": None,
-                        "morph_gloss": None,
-                        "morph_msa": None,
-                        "morph_language": None,
-                    },
-                    {
-                        "phrase_id": "phrase-2",
-                        "word_id": "word-3",
-                        "word_order": 1,
-                        "word_surface_form": "goodbye",
-                        "word_gloss": "BYE",
-                        "word_pos": "V",
-                        "word_language": None,
-                        "morph_id": "morph-2",
-                        "morph_order": 1,
-                        "morph_type": "stem",
-                        "morph_surface_form": "good",
-                        "morph_citation_form": "good",
-                        "morph_gloss": "GOOD",
-                        "morph_msa": "v",
-                        "morph_language": "eng",
-                    },
+                        "text": {
+                            "id": "text-123",
+                            "title": "Sample Text",
+                            "source": "Field Notes",
+                            "comment": "Test dataset",
+                            "language_code": "eng",
+                        },
+                        "sections": [
+                            {
+                                "id": "section-1",
+                                "order": 1,
+                                "phrases": [
+                                    {
+                                        "id": "phrase-1",
+                                        "order": 1,
+                                        "segnum": "1",
+                                        "surface_text": "hello world",
+                                        "language": "eng",
+                                        "words": [
+                                            {
+                                                "id": "word-1",
+                                                "order": 2,
+                                                "surface_form": "hello",
+                                                "gloss": "HEL",
+                                                "pos": ["N"],
+                                                "language": "eng",
+                                                "morphemes": [
+                                                    _morpheme(
+                                                        "morph-1", 1, "hello", "HEL", "n"
+                                                    )
+                                                ],
+                                            },
+                                            {
+                                                "id": "word-2",
+                                                "order": 3,
+                                                "surface_form": ".",
+                                                "gloss": None,
+                                                "pos": ["PUNCT"],
+                                                "language": None,
+                                                "morphemes": [],
+                                            },
+                                        ],
+                                    }
+                                ],
+                            },
+                            {
+                                "id": "section-2",
+                                "order": 2,
+                                "phrases": [
+                                    {
+                                        "id": "phrase-2",
+                                        "order": 5,
+                                        "segnum": "2",
+                                        "surface_text": "second phrase",
+                                        "language": None,
+                                        "words": [
+                                            {
+                                                "id": "word-3",
+                                                "order": 1,
+                                                "surface_form": "goodbye",
+                                                "gloss": "BYE",
+                                                "pos": "V",
+                                                "language": None,
+                                                "morphemes": [
+                                                    _morpheme(
+                                                        "morph-2", 1, "good", "GOOD", "v"
+                                                    )
+                                                ],
+                                            }
+                                        ],
+                                    }
+                                ],
+                            },
+                        ],
+                    }
                 ]
             )
 
-        if "RETURN t.ID AS id" in query:
+        if "UNWIND $text_ids" in query:
+            # Deliberately reversed: results are returned in key order
             return _FakeResult(
                 [
-                    {
-                        "id": params["text_id"],
-                        "title": "Sample Text",
-                        "source": "Field Notes",
-                        "comment": "Test dataset",
-                        "language_code": "eng",
-                    }
+                    {"text": {"id": text_id, "language_code": None}, "sections": []}
+                    for text_id in reversed(params["text_ids"])
                 ]
             )
 
@@ -156,6 +192,7 @@ def test_get_file_graph_data_returns_nested_structure():
 
     words = phrase["words"]
     assert [word["id"] for word in words] == ["word-1", "word-2"]
+    assert words[0]["pos"] == "N"
     assert words[1]["is_punctuation"] is True
     assert words[1]["surface_form"] == "."
 
@@ -164,6 +201,61 @@ def test_get_file_graph_data_returns_nested_structure():
     assert morphemes[0]["gloss"] == "HEL"
 
 
+def test_get_file_graph_data_fetches_hierarchy_in_one_query():
+    session = _FakeSession()
+    get_file_graph_data("text-123", session)
+
+    # One cache-key probe plus one hierarchy query
+    assert session.query_count == 2
+    assert session.graph_query_count == 1
+    assert session.last_params == {"text_ids": ["text-123"]}
+    # Ordering is done by the database, not by a Python post-sort
+    assert "ORDER BY r.Order, w.ID" in session.last_query
+
+
+def test_get_file_graph_data_reuses_cached_graph_until_text_changes():
+    session = _FakeSession()
+    first = get_file_graph_data("text-123", session)
+    second = get_file_graph_data("text-123", session)
+
+    assert session.graph_query_count == 1
+    assert second == first
+    # Each call gets its own copy of the cached payload
+    assert second is not first
+    second["sections"].clear()
+    assert get_file_graph_data("text-123", session)["sections"]
+
+    # A re-upload bumps updated_at, so the cached graph is not used
+    session.updated_at = "2024-03-01T00:00:00Z"
+    get_file_graph_data("text-123", session)
+    assert session.graph_query_count == 2
+
+    text_graph_cache.clear()
+    get_file_graph_data("text-123", session)
+    assert session.graph_query_count == 3
+
+
+def test_get_all_texts_graph_data_fetches_every_text_at_once():
+    session = _FakeSession()
+    graphs = get_all_texts_graph_data(session)
+
+    assert session.graph_query_count == 1
+    assert session.last_params == {"text_ids": ["text-a", "text-b"]}
+    assert [graph["text"]["id"] for graph in graphs] == ["text-a", "text-b"]
+    assert graphs[0]["text"]["language_code"] == "unknown"
+    assert graphs[0]["sections"] == []
+
+
+def test_get_all_texts_graph_data_only_fetches_uncached_texts():
+    session = _FakeSession()
+    get_file_graph_data("text-a", session)
+
+    graphs = get_all_texts_graph_data(session)
+
+    assert session.last_params == {"text_ids": ["text-b"]}
+    assert [graph["text"]["id"] for graph in graphs] == ["text-a", "text-b"]
+
+
 def test_get_file_graph_data_raises_when_text_missing():
     class _EmptySession(_FakeSession):
         def run(self, query: str, **params):
@@ -182,3 +274,21 @@ def test_get_file_graph_data_raises_when_text_missing():
         raise AssertionError("Expected Neo4jExportDataError to be raised")
 
 
+def test_export_fingerprint_changes_when_a_text_is_updated():
+    class _FingerprintSession:
+        def __init__(self, rows):
+            self.rows = rows
+
+        def run(self, query: str, **params):
+            assert "t.updated_at" in query
+            return _FakeResult([{"keys": self.rows}])
+
+    before = [["text-1", "2024-01-01T00:00:00Z", "2024-01-01T00:00:00Z"]]
+    after = [["text-1", "2024-01-01T00:00:00Z", "2024-02-01T00:00:00Z"]]
+
+    assert get_export_fingerprint(_FingerprintSession(before)) == (
+        get_export_fingerprint(_FingerprintSession([list(before[0])]))
+    )
+    assert get_export_fingerprint(_FingerprintSession(before)) != (
+        get_export_fingerprint(_FingerprintSession(after))
+    )
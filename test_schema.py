@@ -0,0 +1,43 @@
+"""Tests for loading the Neo4j schema applied at startup."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
+
+from app.database import DATA_MIGRATION_FILES, load_schema_statements  # noqa: E402
+
+
+def test_schema_statements_are_idempotent_creates():
+    statements = load_schema_statements()
+
+    assert statements
+    for statement in statements:
+        assert statement.startswith("CREATE ")
+        assert "IF NOT EXISTS" in statement
+        assert "//" not in statement
+
+
+def test_schema_includes_text_indexes_for_search():
+    statements = load_schema_statements()
+
+    assert any(
+        "TEXT INDEX word_surface_form_text" in statement for statement in statements
+    )
+    assert any(
+        "TEXT INDEX morpheme_citation_form_text" in statement
+        for statement in statements
+    )
+
+
+def test_data_migrations_only_touch_old_shaped_nodes():
+    assert DATA_MIGRATION_FILES
+    for path in DATA_MIGRATION_FILES:
+        statements = load_schema_statements(path)
+
+        assert statements, path.name
+        # Re-running at every startup must be a no-op once data is migrated
+        assert all("WHERE" in statement for statement in statements), path.name
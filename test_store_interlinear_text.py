@@ -0,0 +1,171 @@
+"""Tests for flattening and persisting uploaded interlinear texts."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from typing import Any, Dict, List
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
+
+from app.models.linguistic import (  # noqa: E402
+    InterlinearTextCreate,
+    MorphemeCreate,
+    MorphemeType,
+    PhraseCreate,
+    SectionCreate,
+    WordCreate,
+)
+import app.routers.linguistic as linguistic  # noqa: E402
+from app.routers.linguistic import (  # noqa: E402
+    _flatten_text,
+    _store_interlinear_text,
+)
+
+
+class _FakeResult:
+    def __init__(self, records: List[Dict[str, Any]]):
+        self._records = records
+
+    def single(self):
+        return self._records[0] if self._records else None
+
+    def __iter__(self):
+        return iter(self._records)
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.calls: List[tuple[str, Dict[str, Any]]] = []
+
+    def run(self, query: str, **params):
+        self.calls.append((query, params))
+        if "MERGE (t:Text" in query:
+            return _FakeResult([{"was_created": True}])
+        return _FakeResult([])
+
+
+def _sample_text() -> InterlinearTextCreate:
+    morpheme = MorphemeCreate(
+        id="morph-1",
+        type=MorphemeType.STEM,
+        surface_form="hel",
+        citation_form="hello",
+        gloss="greet",
+        msa={"cat": "n"},
+        language="eng",
+    )
+    word = WordCreate(
+        id="word-1",
+        surface_form="hello",
+        gloss="HELLO",
+        pos=["INTJ", "N"],
+        morphemes=[morpheme],
+        language="eng",
+    )
+    punct = WordCreate(id="word-2", surface_form=".", pos=["PUNCT"], language="eng")
+    phrase = PhraseCreate(
+        id="phrase-1",
+        segnum="1",
+        surface_text="hello .",
+        words=[word, punct],
+        language="eng",
+    )
+    section = SectionCreate(
+        id="section-1", order=0, phrases=[phrase], words=[word, punct]
+    )
+    return InterlinearTextCreate(
+        id="text-1", title="Sample", language="eng", sections=[section]
+    )
+
+
+def test_flatten_text_emits_rows_for_every_node_and_edge():
+    flat = _flatten_text(_sample_text())
+
+    assert flat.sections == [{"text_id": "text-1", "ID": "section-1", "order": 0}]
+    assert [row["ID"] for row in flat.phrases] == ["phrase-1"]
+
+    # word-1/word-2 appear under both the phrase and the section but are
+    # written once; only the edges are repeated
+    assert list(flat.words) == ["word-1", "word-2"]
+    assert flat.words["word-1"]["pos"] == ["INTJ", "N"]
+
+    assert flat.word_in_phrase_edges == [
+        {"phrase_id": "phrase-1", "word_id": "word-1", "order": 0},
+        {"phrase_id": "phrase-1", "word_id": "word-2", "order": 1},
+    ]
+    assert {edge["word_id"] for edge in flat.word_in_section_edges} == {
+        "word-1",
+        "word-2",
+    }
+
+    assert list(flat.morphemes) == ["morph-1"]
+    assert flat.morphemes["morph-1"]["word_id"] == "word-1"
+    assert flat.morphemes["morph-1"]["msa"] == "cat:n"
+    assert list(flat.word_glosses) == ["gloss-word-word-1"]
+    assert list(flat.morph_glosses.values()) == [
+        {"ID": "gloss-morph-morph-1", "target_id": "morph-1", "annotation": "greet"}
+    ]
+
+
+def test_store_interlinear_text_batches_writes_with_unwind():
+    session = _RecordingSession()
+
+    text_id, was_created = asyncio.run(_store_interlinear_text(_sample_text(), session))
+
+    assert text_id == "text-1"
+    assert was_created is True
+
+    unwind_calls = [call for call in session.calls if "UNWIND $rows" in call[0]]
+    # One round trip per node/relationship kind, independent of tree size
+    assert len(unwind_calls) == 8
+    assert all(params["rows"] for _, params in unwind_calls)
+
+    # Listing counts are refreshed once the children are in place
+    last_query, last_params = session.calls[-1]
+    assert "SET t.section_count" in last_query
+    assert last_params == {"ID": "text-1"}
+
+
+def test_store_interlinear_text_splits_large_row_lists(monkeypatch):
+    monkeypatch.setattr(linguistic, "UPLOAD_BATCH_SIZE", 1)
+    session = _RecordingSession()
+
+    asyncio.run(_store_interlinear_text(_sample_text(), session))
+
+    phrase_edge_batches = [
+        params["rows"]
+        for query, params in session.calls
+        if "PHRASE_COMPOSED_OF" in query
+    ]
+    assert phrase_edge_batches == [
+        [{"phrase_id": "phrase-1", "word_id": "word-1", "order": 0}],
+        [{"phrase_id": "phrase-1", "word_id": "word-2", "order": 1}],
+    ]
+
+
+def test_store_interlinear_text_skips_children_of_existing_text():
+    class _ExistingTextSession(_RecordingSession):
+        def run(self, query: str, **params):
+            if "MERGE (t:Text" in query:
+                self.calls.append((query, params))
+                return _FakeResult([{"was_created": False}])
+            return super().run(query, **params)
+
+    session = _ExistingTextSession()
+
+    text_id, was_created = asyncio.run(_store_interlinear_text(_sample_text(), session))
+
+    assert (text_id, was_created) == ("text-1", False)
+    # The Text MERGE doubles as the existence check; nothing else is written
+    assert len(session.calls) == 1
+
+
+def test_morpheme_msa_list_accepts_non_string_items():
+    morpheme = MorphemeCreate(
+        id="morph-2", type=MorphemeType.STEM, msa=["n", 3], language="eng"
+    )
+
+    assert morpheme.msa == "n,3"
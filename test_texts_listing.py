@@ -0,0 +1,122 @@
+"""Tests for keyset pagination of the text listing."""
+
+from __future__ import annotations
+
+import os
+import sys
+from datetime import datetime, timezone
+from urllib.parse import parse_qs
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
+
+from main import app  # noqa: E402  # isort:skip
+from app.database import get_read_db_dependency  # noqa: E402  # isort:skip
+from app.routers.linguistic import read_cache  # noqa: E402  # isort:skip
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+class _FakeResult:
+    def __init__(self, record):
+        self._record = record
+
+    def single(self):
+        return self._record
+
+
+class _ListingSession:
+    """Applies TEXT_LIST_CYPHER's filter and ordering to in-memory texts."""
+
+    def __init__(self, texts):
+        self.texts = texts
+
+    def run(self, query: str, **params):
+        assert "epochMillis: 0" in query
+        keyed = sorted(
+            (
+                (text["created_at"] or EPOCH, text["ID"], text)
+                for text in self.texts
+            ),
+            key=lambda item: (item[0], item[1]),
+            reverse=True,
+        )
+        if params["after_created_at"] is not None:
+            after = datetime.fromisoformat(
+                params["after_created_at"].replace("Z", "+00:00")
+            )
+            keyed = [
+                item
+                for item in keyed
+                if item[0] < after
+                or (item[0] == after and item[1] < params["after_id"])
+            ]
+        page = keyed[params["skip"] :][: params["limit"]]
+        rows = [
+            {
+                "ID": sort_id,
+                "title": text["ID"],
+                "source": "",
+                "comment": "",
+                "language": "",
+                "section_count": 0,
+                "word_count": 0,
+                "morpheme_count": 0,
+                "created_at": _iso(text["created_at"] or datetime.now(timezone.utc)),
+            }
+            for _, sort_id, text in page
+        ]
+        last_cursor = [_iso(page[-1][0]), page[-1][1]] if page else None
+        return _FakeResult(
+            {"total": len(self.texts), "rows": rows, "last_cursor": last_cursor}
+        )
+
+
+@pytest.fixture
+def client():
+    texts = [
+        {"ID": "a", "created_at": datetime(2024, 1, 2, tzinfo=timezone.utc)},
+        {"ID": "b", "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc)},
+        {"ID": "legacy", "created_at": None},
+        {"ID": "c", "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc)},
+    ]
+
+    def _override():
+        yield _ListingSession(texts)
+
+    read_cache.clear()
+    app.dependency_overrides[get_read_db_dependency] = _override
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_read_db_dependency, None)
+        read_cache.clear()
+
+
+def test_keyset_pages_reach_texts_without_created_at(client):
+    seen = []
+    cursors = []
+    params = {"limit": 1}
+    while True:
+        response = client.get("/api/v1/linguistic/texts", params=params)
+        assert response.status_code == 200
+        seen.extend(text["ID"] for text in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        cursors.append(next_cursor)
+        params = {"limit": 1, **{k: v[0] for k, v in parse_qs(next_cursor).items()}}
+
+    assert seen == ["a", "c", "b", "legacy"]
+    assert parse_qs(cursors[-1]) == {
+        "after_created_at": ["1970-01-01T00:00:00Z"],
+        "after_id": ["legacy"],
+    }
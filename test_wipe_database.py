@@ -0,0 +1,48 @@
+"""Tests for the batched database wipe."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
+
+from app.routers.linguistic import _delete_all_nodes  # noqa: E402
+
+
+class _FakeResult:
+    def __init__(self, record):
+        self._record = record
+
+    def single(self):
+        return self._record
+
+    def consume(self):
+        return None
+
+
+class _IterateSession:
+    def __init__(self, failed_batches: int):
+        self.failed_batches = failed_batches
+
+    def run(self, query: str, **params):
+        assert "apoc.periodic.iterate" in query
+        return _FakeResult(
+            {
+                "batches": 3,
+                "failedBatches": self.failed_batches,
+                "errorMessages": {"LockClient": 1} if self.failed_batches else {},
+            }
+        )
+
+
+def test_delete_all_nodes_accepts_clean_run():
+    _delete_all_nodes(_IterateSession(failed_batches=0))
+
+
+def test_delete_all_nodes_raises_on_failed_batches():
+    with pytest.raises(RuntimeError, match="1 of 3 delete batches failed"):
+        _delete_all_nodes(_IterateSession(failed_batches=1))